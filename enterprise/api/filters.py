@@ -3,11 +3,23 @@
 Filters for enterprise API.
 """
 
+from django_filters.rest_framework import FilterSet
 from rest_framework import filters
 
 from django.contrib.auth.models import User
 
 
+def get_filterset_class(model, fields):
+    """
+    Build a ``FilterSet`` class filtering the given model on the given fields.
+
+    ``DjangoFilterBackend`` builds the same class out of a view's ``filterset_fields`` on every request;
+    views set ``filterset_class`` to the result of this function instead, so it is only built once.
+    """
+    meta = type('Meta', (), {'model': model, 'fields': fields})
+    return type('{model}FilterSet'.format(model=model.__name__), (FilterSet,), {'Meta': meta})
+
+
 class UserFilterBackend(filters.BaseFilterBackend):
     """
     Filter backend for any view that needs to filter against the requesting user's ID.
@@ -5,6 +5,7 @@ Pagination helpers for enterprise api.
 
 from collections import OrderedDict
 
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from six.moves.urllib.parse import urlparse  # pylint: disable=import-error
 
@@ -44,3 +45,13 @@ def get_paginated_response(data, request):
         ('previous', previous_page),
         ('results', data['results'])
     ]))
+
+
+class EnterpriseCursorPagination(CursorPagination):
+    """
+    Keyset pagination for endpoints whose result sets are too large to page through by offset.
+
+    The cursor ordering comes from the view's ``ordering``, so the ordering field should be indexed.
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = 100
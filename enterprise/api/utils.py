@@ -3,7 +3,10 @@
 Utility functions for the Enterprise API.
 """
 
+from uuid import uuid4
+
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext as _
 
 from enterprise.models import (
@@ -11,12 +14,16 @@ from enterprise.models import (
     EnterpriseCustomerReportingConfiguration,
     EnterpriseCustomerUser,
 )
+from enterprise.utils import get_cache_key
 
 SERVICE_USERNAMES = (
     'ECOMMERCE_SERVICE_WORKER_USERNAME',
     'ENTERPRISE_SERVICE_WORKER_USERNAME'
 )
 
+ENTERPRISE_CUSTOMER_BASIC_LIST_GENERATION_CACHE_KEY = 'enterprise_customer_basic_list_generation'
+CONTAINS_CONTENT_ITEMS_GENERATION_CACHE_KEY = 'contains_content_items_generation'
+
 
 def get_service_usernames():
     """
@@ -30,7 +37,9 @@ def get_enterprise_customer_from_catalog_id(catalog_id):
     Get the enterprise customer id given an enterprise customer catalog id.
     """
     try:
-        return str(EnterpriseCustomerCatalog.objects.get(pk=catalog_id).enterprise_customer.uuid)
+        return str(
+            EnterpriseCustomerCatalog.objects.values_list('enterprise_customer_id', flat=True).get(pk=catalog_id)
+        )
     except EnterpriseCustomerCatalog.DoesNotExist:
         return None
 
@@ -40,7 +49,11 @@ def get_ent_cust_from_report_config_uuid(uuid):
     Get the enterprise customer id given an enterprise report configuration UUID.
     """
     try:
-        return str(EnterpriseCustomerReportingConfiguration.objects.get(uuid=uuid).enterprise_customer.uuid)
+        return str(
+            EnterpriseCustomerReportingConfiguration.objects.values_list(
+                'enterprise_customer_id', flat=True
+            ).get(uuid=uuid)
+        )
     except EnterpriseCustomerReportingConfiguration.DoesNotExist:
         return None
 
@@ -50,11 +63,64 @@ def get_enterprise_customer_from_user_id(user_id):
     Get the enterprise customer id given an user id
     """
     try:
-        return str(EnterpriseCustomerUser.objects.get(user_id=user_id).enterprise_customer.uuid)
+        return str(EnterpriseCustomerUser.objects.values_list('enterprise_customer_id', flat=True).get(user_id=user_id))
     except EnterpriseCustomerUser.DoesNotExist:
         return None
 
 
+def get_enterprise_customer_basic_list_cache_key(startswith):
+    """
+    Get the cache key for the enterprise customer basic list filtered by the given name prefix.
+
+    The key includes the current cache generation, so every cached basic list becomes stale
+    as soon as ``invalidate_enterprise_customer_basic_list_cache`` is called.
+    """
+    generation = cache.get_or_set(
+        ENTERPRISE_CUSTOMER_BASIC_LIST_GENERATION_CACHE_KEY,
+        lambda: uuid4().hex,
+        None,
+    )
+    return get_cache_key(
+        resource='enterprise-customer-basic-list',
+        generation=generation,
+        startswith=startswith or '',
+    )
+
+
+def invalidate_enterprise_customer_basic_list_cache():
+    """
+    Invalidate all cached enterprise customer basic lists.
+    """
+    cache.set(ENTERPRISE_CUSTOMER_BASIC_LIST_GENERATION_CACHE_KEY, uuid4().hex, None)
+
+
+def get_contains_content_items_cache_key(resource, pk, course_run_ids, program_uuids):
+    """
+    Get the cache key for a ``contains_content_items`` answer of the given catalog or enterprise customer.
+
+    Content ids are sorted so the same set of ids maps to the same key whatever order they were requested in.
+    """
+    generation = cache.get_or_set(
+        CONTAINS_CONTENT_ITEMS_GENERATION_CACHE_KEY,
+        lambda: uuid4().hex,
+        None,
+    )
+    return get_cache_key(
+        resource=resource,
+        generation=generation,
+        pk=str(pk),
+        course_run_ids=sorted(course_run_ids),
+        program_uuids=sorted(program_uuids),
+    )
+
+
+def invalidate_contains_content_items_cache():
+    """
+    Invalidate all cached ``contains_content_items`` answers.
+    """
+    cache.set(CONTAINS_CONTENT_ITEMS_GENERATION_CACHE_KEY, uuid4().hex, None)
+
+
 def create_message_body(email, enterprise_name, number_of_codes=None, notes=None):
     """
     Return the message body with extra information added by user.
@@ -544,6 +544,23 @@ class EnterpriseCustomerReportingConfigurationSerializer(serializers.ModelSerial
         child=serializers.EmailField()
     )
 
+    def __init__(self, *args, **kwargs):
+        super(EnterpriseCustomerReportingConfigurationSerializer, self).__init__(*args, **kwargs)
+        if 'enterprise_customer_id' in self.context:
+            # The enterprise customer is given by the view, so it is not read from the request data.
+            self.fields.pop('enterprise_customer_id')
+
+    def validate(self, attrs):
+        """
+        Attach the enterprise customer given by the view, if any, to the validated data.
+        """
+        if 'enterprise_customer_id' in self.context:
+            enterprise_customer_id = self.context['enterprise_customer_id']
+            if enterprise_customer_id is None:
+                raise serializers.ValidationError({'enterprise_customer_id': [_('This field may not be null.')]})
+            attrs['enterprise_customer_id'] = enterprise_customer_id
+        return attrs
+
 
 # pylint: disable=abstract-method
 class EnterpriseCustomerCourseEnrollmentsListSerializer(serializers.ListSerializer):
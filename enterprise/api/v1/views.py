@@ -3,8 +3,8 @@
 Views for enterprise api version 1 endpoint.
 """
 
+from functools import lru_cache
 from logging import getLogger
-from smtplib import SMTPException
 
 from django_filters.rest_framework import DjangoFilterBackend
 from edx_rbac.decorators import permission_required
@@ -12,32 +12,42 @@ from edx_rest_framework_extensions.auth.jwt.authentication import JwtAuthenticat
 from rest_framework import filters, permissions, status, viewsets
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.decorators import action, detail_route, list_route
-from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.exceptions import NotFound
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND, HTTP_500_INTERNAL_SERVER_ERROR
+from rest_framework.settings import api_settings
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
 from rest_framework.views import APIView
 from rest_framework_xml.renderers import XMLRenderer
-from six.moves.urllib.parse import quote_plus, unquote  # pylint: disable=import-error,ungrouped-imports
+from simple_history.utils import bulk_update_with_history
 
 from django.apps import apps
 from django.conf import settings
-from django.core import mail
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext as _
+from django.views.decorators.http import condition
 
 from enterprise import models
 from enterprise.api.filters import (
     EnterpriseCustomerUserFilterBackend,
     EnterpriseLinkedUserFilterBackend,
     UserFilterBackend,
+    get_filterset_class,
 )
+from enterprise.api.pagination import EnterpriseCursorPagination
 from enterprise.api.throttles import ServiceUserThrottle
 from enterprise.api.utils import (
     create_message_body,
+    get_contains_content_items_cache_key,
     get_ent_cust_from_report_config_uuid,
+    get_enterprise_customer_basic_list_cache_key,
     get_enterprise_customer_from_catalog_id,
     get_enterprise_customer_from_user_id,
 )
@@ -47,20 +57,41 @@ from enterprise.api.v1.permissions import IsInEnterpriseGroup
 from enterprise.api_client.lms import EnrollmentApiClient
 from enterprise.constants import COURSE_KEY_URL_PATTERN, CourseModes
 from enterprise.errors import CodesAPIRequestError
+from enterprise.tasks import send_coupon_codes_request_email
 from enterprise.utils import NotConnectedToOpenEdX, get_request_value
 from enterprise_learner_portal.utils import CourseRunProgressStatuses, get_course_run_status
 
 try:
-    from lms.djangoapps.certificates.api import get_certificate_for_user
+    from lms.djangoapps.certificates.api import get_certificates_for_user
     from openedx.core.djangoapps.content.course_overviews.api import get_course_overviews
 except ImportError:
     get_course_overviews = None
-    get_certificate_for_user = None
+    get_certificates_for_user = None
 
 
 LOGGER = getLogger(__name__)
 
 
+def _preserve_plus_characters(course_run_ids):
+    """
+    Restore the plus characters in course run keys which query string decoding turned into spaces.
+    """
+    return [course_run_id.replace(' ', '+') for course_run_id in course_run_ids]
+
+
+def _get_enterprise_customer_for_request_user(request):
+    """
+    Get the enterprise customer id of the requesting user, looking it up at most once per request.
+
+    Both the permission check and the view itself need it, so the first lookup is remembered on the request.
+    """
+    if not hasattr(request, '_enterprise_customer_id'):
+        request._enterprise_customer_id = get_enterprise_customer_from_user_id(  # pylint: disable=protected-access
+            request.user.id
+        )
+    return request._enterprise_customer_id  # pylint: disable=protected-access
+
+
 class EnterpriseViewSet:
     """
     Base class for all Enterprise view sets.
@@ -126,7 +157,7 @@ class EnterpriseCustomerViewSet(EnterpriseReadWriteModelViewSet):
         'uuid', 'slug', 'name', 'active', 'site', 'enable_data_sharing_consent',
         'enforce_data_sharing_consent',
     )
-    filterset_fields = FIELDS
+    filterset_class = get_filterset_class(models.EnterpriseCustomer, FIELDS)
     ordering_fields = FIELDS
 
     def get_serializer_class(self):
@@ -141,11 +172,16 @@ class EnterpriseCustomerViewSet(EnterpriseReadWriteModelViewSet):
             Enterprise Customer's Basic data list without pagination
         """
         startswith = request.GET.get('startswith')
-        queryset = self.get_queryset().order_by('name')
-        if startswith:
-            queryset = queryset.filter(name__istartswith=startswith)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        cache_key = get_enterprise_customer_basic_list_cache_key(startswith)
+        data = cache.get(cache_key)
+        if data is None:
+            queryset = self.get_queryset().only('uuid', 'name').order_by('name')
+            if startswith:
+                queryset = queryset.filter(name__istartswith=startswith)
+            serializer = self.get_serializer(queryset, many=True)
+            data = serializer.data
+            cache.set(cache_key, data, settings.ENTERPRISE_API_CACHE_TIMEOUT)
+        return Response(data)
 
     @method_decorator(require_at_least_one_query_parameter('course_run_ids', 'program_uuids'))
     @detail_route()
@@ -161,17 +197,50 @@ class EnterpriseCustomerViewSet(EnterpriseReadWriteModelViewSet):
         """
         enterprise_customer = self.get_object()
 
-        # Maintain plus characters in course key.
-        course_run_ids = [unquote(quote_plus(course_run_id)) for course_run_id in course_run_ids]
+        course_run_ids = _preserve_plus_characters(course_run_ids)
+
+        cache_key = get_contains_content_items_cache_key(
+            'enterprise-customer-contains-content-items',
+            enterprise_customer.uuid,
+            course_run_ids,
+            program_uuids,
+        )
+        contains_content_items = cache.get(cache_key)
+        if contains_content_items is not None:
+            return Response({'contains_content_items': contains_content_items})
+
+        # Pull in each catalog's saved query up front; ``contains_courses``/``contains_programs``
+        # read its content filter, which would otherwise cost one extra query per catalog. Nothing
+        # but the content filters is read, so skip the other columns and stream the catalogs, as
+        # the loop usually stops at the first one that contains the content.
+        catalogs = enterprise_customer.enterprise_customer_catalogs.select_related(
+            'enterprise_catalog_query',
+        ).only(
+            'uuid',
+            'content_filter',
+            'enterprise_customer',
+            'enterprise_catalog_query',
+            'enterprise_catalog_query__content_filter',
+        )
 
         contains_content_items = False
-        for catalog in enterprise_customer.enterprise_customer_catalogs.all():
+        checked_content_filters = []
+        for catalog in catalogs.iterator():
+            # Catalog membership is answered by the discovery service rather than the database, so the
+            # cheapest check is the one never made: a catalog whose content filter matches one already
+            # checked (and found lacking) cannot contain the content either.
+            content_filter = catalog.get_content_filter()
+            if content_filter in checked_content_filters:
+                continue
+            checked_content_filters.append(content_filter)
+
             contains_course_runs = not course_run_ids or catalog.contains_courses(course_run_ids)
             contains_program_uuids = not program_uuids or catalog.contains_programs(program_uuids)
             if contains_course_runs and contains_program_uuids:
                 contains_content_items = True
                 break
 
+        cache.set(cache_key, contains_content_items, settings.ENTERPRISE_API_CACHE_TIMEOUT)
         return Response({'contains_content_items': contains_content_items})
 
     @detail_route(methods=['post'], permission_classes=[permissions.IsAuthenticated])
@@ -202,17 +271,7 @@ class EnterpriseCustomerViewSet(EnterpriseReadWriteModelViewSet):
         """
         Returns the list of enterprise customers the user has a specified group permission access to.
         """
-        self.queryset = self.queryset.order_by('name')
-        enterprise_id = self.request.query_params.get('enterprise_id', None)
-        enterprise_slug = self.request.query_params.get('enterprise_slug', None)
-        enterprise_name = self.request.query_params.get('search', None)
-
-        if enterprise_id is not None:
-            self.queryset = self.queryset.filter(uuid=enterprise_id)
-        elif enterprise_slug is not None:
-            self.queryset = self.queryset.filter(slug=enterprise_slug)
-        elif enterprise_name is not None:
-            self.queryset = self.queryset.filter(name__icontains=enterprise_name)
+        self.queryset = self._get_name_ordered_queryset_for_lookup()
         return self.list(request, *args, **kwargs)
 
     @list_route()
@@ -221,18 +280,33 @@ class EnterpriseCustomerViewSet(EnterpriseReadWriteModelViewSet):
         """
         Supports listing dashboard enterprises for frontend-app-admin-portal.
         """
-        self.queryset = self.queryset.order_by('name')
+        self.queryset = self._get_name_ordered_queryset_for_lookup()
+        return self.list(request, *args, **kwargs)
+
+    def _get_name_ordered_queryset_for_lookup(self):
+        """
+        Return the enterprise customers matching the lookup query parameters, ordered by name.
+
+        Only the first of the ``enterprise_id``, ``enterprise_slug`` and ``search`` query parameters present
+        in the request is applied. The relations rendered by ``EnterpriseCustomerSerializer`` are selected
+        in the same query so that listing them does not cost extra queries per customer.
+        """
+        queryset = self.queryset.select_related(
+            'site',
+            'branding_configuration',
+            'enterprise_customer_identity_provider',
+        ).order_by('name')
         enterprise_id = self.request.query_params.get('enterprise_id', None)
         enterprise_slug = self.request.query_params.get('enterprise_slug', None)
         enterprise_name = self.request.query_params.get('search', None)
 
         if enterprise_id is not None:
-            self.queryset = self.queryset.filter(uuid=enterprise_id)
+            queryset = queryset.filter(uuid=enterprise_id)
         elif enterprise_slug is not None:
-            self.queryset = self.queryset.filter(slug=enterprise_slug)
+            queryset = queryset.filter(slug=enterprise_slug)
         elif enterprise_name is not None:
-            self.queryset = self.queryset.filter(name__icontains=enterprise_name)
-        return self.list(request, *args, **kwargs)
+            queryset = queryset.filter(name__icontains=enterprise_name)
+        return queryset
 
 
 class EnterpriseCourseEnrollmentViewSet(EnterpriseReadWriteModelViewSet):
@@ -246,8 +320,22 @@ class EnterpriseCourseEnrollmentViewSet(EnterpriseReadWriteModelViewSet):
     FIELDS = (
         'enterprise_customer_user', 'course_id'
     )
-    filterset_fields = FIELDS
+    filterset_class = get_filterset_class(models.EnterpriseCourseEnrollment, FIELDS)
     ordering_fields = FIELDS
+    ordering = ('id',)
+
+    @property
+    def pagination_class(self):
+        """
+        Page through the enrollments by cursor when the client asks for it with ``?pagination=cursor``.
+
+        The enrollments of a large enterprise run to many pages, and every page-number page has to skip
+        over all the rows before it. Page numbers stay the default for existing clients.
+        """
+        request = getattr(self, 'request', None)
+        if request is not None and request.query_params.get('pagination') == 'cursor':
+            return EnterpriseCursorPagination
+        return api_settings.DEFAULT_PAGINATION_CLASS
 
     def get_serializer_class(self):
         """
@@ -282,45 +370,97 @@ class LicensedEnterpriseCourseEnrollmentViewSet(EnterpriseWrapperApiViewSet):
 
         return None
 
+    @staticmethod
+    def _revoke_enrollments(licensed_enrollments, user=None):
+        """
+        Mark the given licensed enterprise course enrollments as "revoked" and their enrollments as "saved for later".
+
+        Arguments:
+            licensed_enrollments (list): The ``LicensedEnterpriseCourseEnrollment`` objects to update.
+            user (User): The user performing the revocation, recorded as the history user of the updates.
+        """
+        if not licensed_enrollments:
+            return
+
+        modified = timezone.now()
+        enterprise_enrollments = []
+        for licensed_enrollment in licensed_enrollments:
+            licensed_enrollment.is_revoked = True
+            licensed_enrollment.modified = modified
+
+            enterprise_enrollment = licensed_enrollment.enterprise_course_enrollment
+            enterprise_enrollment.saved_for_later = True
+            enterprise_enrollment.modified = modified
+            enterprise_enrollments.append(enterprise_enrollment)
+
+        with transaction.atomic():
+            bulk_update_with_history(
+                licensed_enrollments,
+                models.LicensedEnterpriseCourseEnrollment,
+                ['is_revoked', 'modified'],
+                default_user=user,
+            )
+            bulk_update_with_history(
+                enterprise_enrollments,
+                models.EnterpriseCourseEnrollment,
+                ['saved_for_later', 'modified'],
+                default_user=user,
+            )
+
     @action(methods=['post'], detail=False)
     @permission_required('enterprise.can_access_admin_dashboard', fn=lambda request: request.data.get('enterprise_id'))
     def license_revoke(self, request, *args, **kwargs):
         """
         Changes the mode for a user's licensed enterprise course enrollments to the "audit" course mode.
         """
-        if get_course_overviews is None or get_certificate_for_user is None:
+        if get_course_overviews is None or get_certificates_for_user is None:
             raise NotConnectedToOpenEdX(
                 _('To use this endpoint, this package must be '
                   'installed in an Open edX environment.')
             )
 
-        request_data = request.data.copy()
-        self._validate_license_revoke_data(request_data)
+        self._validate_license_revoke_data(request.data)
 
-        user_id = request_data.get('user_id')
-        enterprise_id = request_data.get('enterprise_id')
+        user_id = request.data.get('user_id')
+        enterprise_id = request.data.get('enterprise_id')
         audit_mode = CourseModes.AUDIT
 
+        # only the id is needed to find the enrollments and the user_id to find the username
         enterprise_customer_user = get_object_or_404(
-            models.EnterpriseCustomerUser,
+            models.EnterpriseCustomerUser.objects.only('id', 'user_id', 'enterprise_customer_id'),
             user_id=user_id,
             enterprise_customer=enterprise_id,
         )
         licensed_enrollments = self.queryset.filter(
             enterprise_course_enrollment__enterprise_customer_user=enterprise_customer_user
-        )
+        ).select_related('enterprise_course_enrollment')
 
-        enrollments_by_course_id = {
-            enrollment.enterprise_course_enrollment.course_id: enrollment.enterprise_course_enrollment
+        licensed_enrollments_by_course_id = {
+            enrollment.enterprise_course_enrollment.course_id: enrollment
             for enrollment in licensed_enrollments
         }
-        course_overviews = get_course_overviews(list(enrollments_by_course_id.keys()))
-
+        if not licensed_enrollments_by_course_id:
+            # nothing to revoke, so skip the course overviews lookup altogether
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        # the course run status check needs the pacing and start/end state of each run, which is
+        # only available from the course overviews.
+        course_overviews = get_course_overviews(list(licensed_enrollments_by_course_id.keys()))
+
+        # ``EnterpriseCustomerUser.username`` looks the user up on every access, so do it just once
+        username = enterprise_customer_user.username
+        # fetch all of the learner's certificates at once rather than one course at a time
+        certificates_by_course_id = {
+            str(certificate['course_key']): certificate
+            for certificate in get_certificates_for_user(username)
+        }
         enrollment_api_client = EnrollmentApiClient()
+        revoked_enrollments = []
         for course_overview in course_overviews:
             course_run_id = course_overview.get('id')
-            enterprise_enrollment = enrollments_by_course_id.get(course_run_id)
-            certificate_info = get_certificate_for_user(enterprise_customer_user.username, course_run_id) or {}
+            licensed_enrollment = licensed_enrollments_by_course_id.get(course_run_id)
+            enterprise_enrollment = licensed_enrollment.enterprise_course_enrollment
+            certificate_info = certificates_by_course_id.get(course_run_id, {})
             course_run_status = get_course_run_status(
                 course_overview,
                 certificate_info,
@@ -334,14 +474,14 @@ class LicensedEnterpriseCourseEnrollmentViewSet(EnterpriseWrapperApiViewSet):
 
             try:
                 enrollment_api_client.update_course_enrollment_mode_for_user(
-                    username=enterprise_customer_user.username,
+                    username=username,
                     course_id=course_run_id,
                     mode=audit_mode,
                 )
                 LOGGER.info(
                     'Updated LMS enrollment for User {user} and Enterprise {enterprise} in Course {course_id} '
                     'to Course Mode {mode}.'.format(
-                        user=enterprise_customer_user.username,
+                        user=username,
                         enterprise=enterprise_id,
                         course_id=course_run_id,
                         mode=audit_mode,
@@ -351,24 +491,20 @@ class LicensedEnterpriseCourseEnrollmentViewSet(EnterpriseWrapperApiViewSet):
                 msg = (
                     'Unable to update LMS enrollment for User {user} and Enterprise {enterprise} in Course {course_id} '
                     'to Course Mode {mode}'.format(
-                        user=enterprise_customer_user.username,
+                        user=username,
                         enterprise=enterprise_id,
                         course_id=course_run_id,
                         mode=audit_mode,
                     )
                 )
                 LOGGER.error('{msg}: {exc}'.format(msg=msg, exc=exc))
+                # keep the enrollments which were already moved to audit in sync with the LMS
+                self._revoke_enrollments(revoked_enrollments, user=request.user)
                 return Response(msg, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-            # mark the licensed enterprise course enrollment as "revoked"
-            licensed_enrollment = enterprise_enrollment.license
-            licensed_enrollment.is_revoked = True
-            licensed_enrollment.save()
-
-            # mark the enterprise course enrollment as "saved for later"
-            enterprise_enrollment.saved_for_later = True
-            enterprise_enrollment.save()
+            revoked_enrollments.append(licensed_enrollment)
 
+        self._revoke_enrollments(revoked_enrollments, user=request.user)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -377,13 +513,19 @@ class EnterpriseCustomerUserViewSet(EnterpriseReadWriteModelViewSet):
     API views for the ``enterprise-learner`` API endpoint.
     """
 
-    queryset = models.EnterpriseCustomerUser.objects.all()
+    # The read-only serializer nests the full EnterpriseCustomer, including its site, branding
+    # configuration and identity provider, so join them in rather than fetching them per learner.
+    queryset = models.EnterpriseCustomerUser.objects.select_related(
+        'enterprise_customer__site',
+        'enterprise_customer__branding_configuration',
+        'enterprise_customer__enterprise_customer_identity_provider',
+    )
     filter_backends = (filters.OrderingFilter, DjangoFilterBackend, EnterpriseCustomerUserFilterBackend)
 
     FIELDS = (
         'enterprise_customer', 'user_id', 'active',
     )
-    filterset_fields = FIELDS
+    filterset_class = get_filterset_class(models.EnterpriseCustomerUser, FIELDS)
     ordering_fields = FIELDS
 
     def get_serializer_class(self):
@@ -408,33 +550,41 @@ class PendingEnterpriseCustomerUserViewSet(EnterpriseReadWriteModelViewSet):
     FIELDS = (
         'enterprise_customer', 'user_email',
     )
-    filterset_fields = FIELDS
+    filterset_class = get_filterset_class(models.PendingEnterpriseCustomerUser, FIELDS)
     ordering_fields = FIELDS
 
+    @staticmethod
+    def _learner_exists(user_email, enterprise_customer):
+        """
+        Return whether a pending or linked learner already exists for the given email and enterprise customer.
+
+        Arguments:
+            user_email (str): The email address of the learner.
+            enterprise_customer (str): The UUID of the enterprise customer.
+        """
+        # ``user_email`` is unique across all pending learners, whatever their enterprise customer.
+        if models.PendingEnterpriseCustomerUser.objects.filter(user_email=user_email).exists():
+            return True
+
+        try:
+            return models.EnterpriseCustomerUser.objects.filter(
+                enterprise_customer=enterprise_customer,
+                user_id__in=User.objects.filter(email=user_email).values('id'),
+            ).exists()
+        except ValidationError:
+            # A malformed enterprise customer UUID; the serializer reports it.
+            return False
+
     def create(self, request, *args, **kwargs):
+        # Nothing needs to be created for a learner who is already pending or linked, so check for that
+        # up front rather than running the serializer validation and picking the duplicate out of its errors.
+        if self._learner_exists(request.data.get('user_email'), request.data.get('enterprise_customer')):
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
         serializer = self.get_serializer(data=request.data)
-        try:
-            serializer.is_valid(raise_exception=True)
-        except ValidationError as validation_error:
-            return_status = None
-            if 'user_email' in serializer.errors:
-                for error in serializer.errors['user_email']:
-                    # This error indicates that a PendingEnterpriseCustomerUser already exists.
-                    if error.code == 'unique':
-                        return_status = status.HTTP_204_NO_CONTENT
-                        break
-            elif 'non_field_errors' in serializer.errors:
-                for error in serializer.errors['non_field_errors']:
-                    # This error indicates that an EnterpriseCustomerUser already exists.
-                    if str(error) == 'EnterpriseCustomerUser record already exists':
-                        return_status = status.HTTP_204_NO_CONTENT
-                        break
-
-            if not return_status:
-                raise validation_error
-        else:
-            created = serializer.save()
-            return_status = status.HTTP_201_CREATED if created else status.HTTP_204_NO_CONTENT
+        serializer.is_valid(raise_exception=True)
+        created = serializer.save()
+        return_status = status.HTTP_201_CREATED if created else status.HTTP_204_NO_CONTENT
         headers = self.get_success_headers(serializer.data)
         return Response(serializer.data, status=return_status, headers=headers)
 
@@ -444,14 +594,25 @@ class EnterpriseCustomerBrandingConfigurationViewSet(EnterpriseReadOnlyModelView
     API views for the ``enterprise-customer-branding`` API endpoint.
     """
 
-    queryset = models.EnterpriseCustomerBrandingConfiguration.objects.all()
+    # The serializer reads the enterprise customer's slug, so join the enterprise customer but skip the
+    # rest of its columns.
+    queryset = models.EnterpriseCustomerBrandingConfiguration.objects.select_related(
+        'enterprise_customer',
+    ).only(
+        'enterprise_customer',
+        'enterprise_customer__slug',
+        'logo',
+        'primary_color',
+        'secondary_color',
+        'tertiary_color',
+    )
     serializer_class = serializers.EnterpriseCustomerBrandingConfigurationSerializer
 
     USER_ID_FILTER = 'enterprise_customer__enterprise_customer_users__user_id'
     FIELDS = (
         'enterprise_customer__slug',
     )
-    filterset_fields = FIELDS
+    filterset_class = get_filterset_class(models.EnterpriseCustomerBrandingConfiguration, FIELDS)
     ordering_fields = FIELDS
     lookup_field = 'enterprise_customer__slug'
 
@@ -466,7 +627,7 @@ class EnterpriseCustomerCatalogViewSet(EnterpriseReadOnlyModelViewSet):
     FIELDS = (
         'uuid', 'enterprise_customer',
     )
-    filterset_fields = FIELDS
+    filterset_class = get_filterset_class(models.EnterpriseCustomerCatalog, FIELDS)
     ordering_fields = FIELDS
     renderer_classes = (JSONRenderer, XMLRenderer,)
 
@@ -499,8 +660,17 @@ class EnterpriseCustomerCatalogViewSet(EnterpriseReadOnlyModelViewSet):
         """
         enterprise_customer_catalog = self.get_object()
 
-        # Maintain plus characters in course key.
-        course_run_ids = [unquote(quote_plus(course_run_id)) for course_run_id in course_run_ids]
+        course_run_ids = _preserve_plus_characters(course_run_ids)
+
+        cache_key = get_contains_content_items_cache_key(
+            'enterprise-customer-catalog-contains-content-items',
+            enterprise_customer_catalog.uuid,
+            course_run_ids,
+            program_uuids,
+        )
+        contains_content_items = cache.get(cache_key)
+        if contains_content_items is not None:
+            return Response({'contains_content_items': contains_content_items})
 
         contains_content_items = True
         if course_run_ids:
@@ -511,6 +681,7 @@ class EnterpriseCustomerCatalogViewSet(EnterpriseReadOnlyModelViewSet):
                 enterprise_customer_catalog.contains_programs(program_uuids)
             )
 
+        cache.set(cache_key, contains_content_items, settings.ENTERPRISE_API_CACHE_TIMEOUT)
         return Response({'contains_content_items': contains_content_items})
 
     @detail_route(url_path='courses/{}'.format(COURSE_KEY_URL_PATTERN))
@@ -612,7 +783,7 @@ class EnterpriseCustomerReportingConfigurationViewSet(EnterpriseReadWriteModelVi
     FIELDS = (
         'enterprise_customer',
     )
-    filterset_fields = FIELDS
+    filterset_class = get_filterset_class(models.EnterpriseCustomerReportingConfiguration, FIELDS)
     ordering_fields = FIELDS
 
     @permission_required(
@@ -624,18 +795,18 @@ class EnterpriseCustomerReportingConfigurationViewSet(EnterpriseReadWriteModelVi
 
     @permission_required(
         'enterprise.can_manage_reporting_config',
-        fn=lambda request, *args, **kwargs: get_enterprise_customer_from_user_id(request.user.id))
+        fn=lambda request, *args, **kwargs: _get_enterprise_customer_for_request_user(request))
     def list(self, request, *args, **kwargs):
         # pylint: disable=no-member
         return super(EnterpriseCustomerReportingConfigurationViewSet, self).list(request, *args, **kwargs)
 
     @permission_required(
         'enterprise.can_manage_reporting_config',
-        fn=lambda request, *args, **kwargs: get_enterprise_customer_from_user_id(request.user.id))
+        fn=lambda request, *args, **kwargs: _get_enterprise_customer_for_request_user(request))
     def create(self, request, *args, **kwargs):
-        config_data = request.data.copy()
-        config_data['enterprise_customer_id'] = get_enterprise_customer_from_user_id(request.user.id)
-        serializer = self.get_serializer(data=config_data)
+        context = self.get_serializer_context()
+        context['enterprise_customer_id'] = _get_enterprise_customer_for_request_user(request)
+        serializer = self.get_serializer_class()(data=request.data, context=context)
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
@@ -663,6 +834,24 @@ class EnterpriseCustomerReportingConfigurationViewSet(EnterpriseReadWriteModelVi
         return super(EnterpriseCustomerReportingConfigurationViewSet, self).destroy(request, *args, **kwargs)
 
 
+@lru_cache(maxsize=None)
+def _get_enterprise_app_config():
+    """
+    Return the enterprise app config, which does not change once the app registry is ready.
+    """
+    return apps.get_app_config("enterprise")
+
+
+def _get_catalog_query_etag(request, catalog_query_id):  # pylint: disable=unused-argument
+    """
+    Return an ETag for the enterprise catalog query built from when it was last modified, or None if it does not exist.
+    """
+    modified = models.EnterpriseCatalogQuery.objects.filter(
+        pk=catalog_query_id
+    ).values_list('modified', flat=True).first()
+    return modified.isoformat() if modified else None
+
+
 class CatalogQueryView(APIView):
     """
     View for enterprise catalog query.
@@ -672,15 +861,19 @@ class CatalogQueryView(APIView):
     permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
     http_method_names = ['get']
 
+    # Answer with 304 Not Modified, without loading the content filter, when the admin already has the latest one.
+    @method_decorator(condition(etag_func=_get_catalog_query_etag))
     def get(self, request, catalog_query_id):
         """
         API endpoint for fetching an enterprise catalog query.
         """
         try:
-            catalog_query = models.EnterpriseCatalogQuery.objects.get(pk=catalog_query_id)
+            content_filter = models.EnterpriseCatalogQuery.objects.values_list(
+                'content_filter', flat=True
+            ).get(pk=catalog_query_id)
         except models.EnterpriseCatalogQuery.DoesNotExist:
             return Response({"detail": "Could not find enterprise catalog query."}, status=HTTP_404_NOT_FOUND)
-        return Response(catalog_query.content_filter, status=HTTP_200_OK)
+        return Response(content_filter, status=HTTP_200_OK)
 
 
 class CouponCodesView(APIView):
@@ -758,7 +951,7 @@ class CouponCodesView(APIView):
             token_enterprise_name=enterprise_name
         )
         body_msg = create_message_body(email, enterprise_name, number_of_codes, notes)
-        app_config = apps.get_app_config("enterprise")
+        app_config = _get_enterprise_app_config()
         from_email_address = app_config.enterprise_integrations_email
         cs_email = app_config.customer_success_email
         data = {
@@ -767,27 +960,10 @@ class CouponCodesView(APIView):
             self.OPTIONAL_PARAM_NUMBER_OF_CODES: number_of_codes,
             self.OPTIONAL_PARAM_NOTES: notes,
         }
-        try:
-            messages_sent = mail.send_mail(
-                subject_line,
-                body_msg,
-                from_email_address,
-                [cs_email],
-                fail_silently=False
-            )
-            LOGGER.info('[Enterprise API] Coupon code request emails sent: %s', messages_sent)
-            return Response(data, status=HTTP_200_OK)
-        except SMTPException:
-            error_message = _(
-                '[Enterprise API] Failure in sending e-mail to support.'
-                ' SupportEmail: {token_cs_email}, UserEmail: {token_email}, EnterpriseName: {token_enterprise_name}'
-            ).format(
-                token_cs_email=cs_email,
-                token_email=email,
-                token_enterprise_name=enterprise_name
-            )
-            LOGGER.error(error_message)
-            return Response(
-                {'error': str('Request codes email could not be sent')},
-                status=HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        send_coupon_codes_request_email.delay(
+            subject_line,
+            body_msg,
+            from_email_address,
+            [cs_email],
+        )
+        return Response(data, status=HTTP_200_OK)
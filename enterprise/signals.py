@@ -10,11 +10,16 @@ from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from enterprise.api.utils import (
+    invalidate_contains_content_items_cache,
+    invalidate_enterprise_customer_basic_list_cache,
+)
 from enterprise.api_client.enterprise_catalog import EnterpriseCatalogApiClient
 from enterprise.constants import ENTERPRISE_ADMIN_ROLE, ENTERPRISE_LEARNER_ROLE
 from enterprise.decorators import disable_for_loaddata
 from enterprise.models import (
     EnterpriseCatalogQuery,
+    EnterpriseCustomer,
     EnterpriseCustomerCatalog,
     EnterpriseCustomerUser,
     PendingEnterpriseCustomerAdminUser,
@@ -97,6 +102,26 @@ def handle_user_post_save(sender, **kwargs):  # pylint: disable=unused-argument
         pending_ecu.delete()
 
 
+@receiver(post_save, sender=EnterpriseCustomer)
+@receiver(post_delete, sender=EnterpriseCustomer)
+def invalidate_enterprise_customer_basic_list(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drop the cached enterprise customer basic lists whenever an EnterpriseCustomer changes.
+    """
+    invalidate_enterprise_customer_basic_list_cache()
+
+
+@receiver(post_save, sender=EnterpriseCatalogQuery)
+@receiver(post_delete, sender=EnterpriseCatalogQuery)
+@receiver(post_save, sender=EnterpriseCustomerCatalog)
+@receiver(post_delete, sender=EnterpriseCustomerCatalog)
+def invalidate_contains_content_items(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drop the cached ``contains_content_items`` answers whenever a catalog or its content filter changes.
+    """
+    invalidate_contains_content_items_cache()
+
+
 @receiver(post_save, sender=EnterpriseCustomerCatalog, dispatch_uid='default_content_filter')
 def default_content_filter(sender, instance, **kwargs):     # pylint: disable=unused-argument
     """
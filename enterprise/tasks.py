@@ -4,9 +4,12 @@ Django tasks.
 """
 
 from logging import getLogger
+from smtplib import SMTPException
 
 from celery import shared_task
 
+from django.core import mail
+
 from enterprise.models import EnterpriseCourseEnrollment, EnterpriseCustomerUser, EnterpriseEnrollmentSource
 
 LOGGER = getLogger(__name__)
@@ -52,3 +55,25 @@ def create_enterprise_enrollment(course_id, enterprise_customer_user_id):
             enterprise_customer_user=enterprise_customer_user,
             source=EnterpriseEnrollmentSource.get_source(EnterpriseEnrollmentSource.ENROLLMENT_TASK)
         )
+
+
+@shared_task(autoretry_for=(SMTPException,), retry_backoff=True, max_retries=5)
+def send_coupon_codes_request_email(subject, body, from_email, recipient_list):
+    """
+    Send the email requesting more coupon codes for an enterprise, retrying with backoff if it fails.
+    """
+    try:
+        messages_sent = mail.send_mail(
+            subject,
+            body,
+            from_email,
+            recipient_list,
+            fail_silently=False,
+        )
+    except SMTPException:
+        LOGGER.error(
+            '[Enterprise API] Failure in sending coupon code request e-mail to support. SupportEmail: %s',
+            ', '.join(recipient_list),
+        )
+        raise
+    LOGGER.info('[Enterprise API] Coupon code request emails sent: %s', messages_sent)
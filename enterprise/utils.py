@@ -681,8 +681,13 @@ def get_request_value(request, key, default=None):
     :return: The value we're looking for.
     """
     if request.method in ['GET', 'DELETE']:
-        return request.query_params.get(key, request.data.get(key, default))
-    return request.data.get(key, request.query_params.get(key, default))
+        values, fallback_values = request.query_params, request.data
+    else:
+        values, fallback_values = request.data, request.query_params
+    # Only look at the other source when needed; reading ``request.data`` parses the request body.
+    if key in values:
+        return values[key]
+    return fallback_values.get(key, default)
 
 
 def get_program_type_description(program_type):
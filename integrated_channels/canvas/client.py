@@ -2,17 +2,29 @@
 """
 Client for connecting to Canvas.
 """
+import datetime
 import json
+import time
 
 import requests
 from six.moves.urllib.parse import urljoin  # pylint: disable=import-error
 
 from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
 
 from enterprise.constants import ContentType
+from enterprise.utils import get_cache_key
 from integrated_channels.exceptions import CanvasClientError, ClientError
 from integrated_channels.integrated_channel.client import IntegratedChannelApiClient
 
+# Canvas OAuth access tokens and their expiration datetimes by enterprise configuration ID, shared by the
+# clients created in this process.
+_OAUTH_ACCESS_TOKENS = {}
+
+# Tokens are treated as expired this long before Canvas says they expire, so that one is not sent just as it runs out.
+OAUTH_ACCESS_TOKEN_EXPIRY_MARGIN = datetime.timedelta(seconds=60)
+
 
 class CanvasAPIClient(IntegratedChannelApiClient):
     """
@@ -50,6 +62,7 @@ class CanvasAPIClient(IntegratedChannelApiClient):
         self.config = apps.get_app_config('canvas')
         self.session = None
         self.expires_at = None
+        self.course_ids_by_integration_id = None
         self.course_create_url = CanvasAPIClient.course_create_endpoint(
             self.enterprise_configuration.canvas_base_url,
             self.enterprise_configuration.canvas_account_id
@@ -91,27 +104,34 @@ class CanvasAPIClient(IntegratedChannelApiClient):
         self._create_session()
 
         integration_id = self._get_integration_id_from_transmition_data(serialized_data)
-        course_id = self._get_course_id_from_integration_id(integration_id)
 
-        url = CanvasAPIClient.course_update_endpoint(
-            self.enterprise_configuration.canvas_base_url,
-            course_id,
+        return self._request_course(
+            integration_id,
+            lambda course_id: self._put(
+                CanvasAPIClient.course_update_endpoint(self.enterprise_configuration.canvas_base_url, course_id),
+                serialized_data,
+            ),
         )
 
-        return self._put(url, serialized_data)
-
     def delete_content_metadata(self, serialized_data):
         self._create_session()
 
         integration_id = self._get_integration_id_from_transmition_data(serialized_data)
-        course_id = self._get_course_id_from_integration_id(integration_id)
 
-        url = '{}/api/v1/courses/{}'.format(
-            self.enterprise_configuration.canvas_base_url,
-            course_id,
+        status_code, response_text = self._request_course(
+            integration_id,
+            lambda course_id: self._delete('{}/api/v1/courses/{}'.format(
+                self.enterprise_configuration.canvas_base_url,
+                course_id,
+            )),
         )
-
-        return self._delete(url)
+        self.course_ids_by_integration_id.pop(integration_id, None)
+        cache.set(
+            self._get_course_ids_cache_key(),
+            self.course_ids_by_integration_id,
+            settings.ENTERPRISE_API_CACHE_TIMEOUT,
+        )
+        return status_code, response_text
 
     def create_course_completion(self, user_id, payload):  # pylint: disable=unused-argument
         learner_data = json.loads(payload)
@@ -173,18 +193,56 @@ class CanvasAPIClient(IntegratedChannelApiClient):
         """
         Instantiate a new session object for use in connecting with Canvas. Each enterprise customer
         connecting to Canvas should have a single client session.
+
+        The session is reused until its access token expires, so that transmitting several items does not
+        request a new token for each one.
+        """
+        now = datetime.datetime.utcnow()
+        if self.session is None or self.expires_at is None or now >= self.expires_at:
+            # Create a new session with a valid token
+            if self.session:
+                self.session.close()
+            oauth_access_token, expires_at = self._get_cached_oauth_access_token()
+            session = requests.Session()
+            session.headers['Authorization'] = 'Bearer {}'.format(oauth_access_token)
+            session.headers['content-type'] = 'application/json'
+            session.hooks['response'].append(self._expire_rejected_access_token)
+            self.session = session
+            self.expires_at = expires_at
+
+    def _expire_rejected_access_token(self, response, *args, **kwargs):  # pylint: disable=unused-argument
         """
-        if self.session:
-            self.session.close()
-        # Create a new session with a valid token
-        oauth_access_token = self._get_oauth_access_token(
+        Forget the access token when Canvas rejects it, for instance because the refresh token was revoked.
+
+        The failed request is not retried, but the next session created by any client in this process for
+        this configuration gets a new token instead of reusing the rejected one until it was due to expire.
+        """
+        if response.status_code == 401:
+            _OAUTH_ACCESS_TOKENS.pop(self.enterprise_configuration.id, None)
+            self.expires_at = None
+
+    def _get_cached_oauth_access_token(self):
+        """
+        Return the OAuth access token and its expiration datetime for this client's configuration.
+
+        A token whose expiration is known is kept in this process until shortly before it expires, so that the
+        clients created for each transmission reuse it instead of each requesting their own. Tokens are never
+        stored in the shared cache.
+        """
+        cached_access_token = _OAUTH_ACCESS_TOKENS.get(self.enterprise_configuration.id)
+        if cached_access_token is not None and datetime.datetime.utcnow() < cached_access_token[1]:
+            return cached_access_token
+
+        oauth_access_token, expires_at = self._get_oauth_access_token(
             self.enterprise_configuration.client_id,
             self.enterprise_configuration.client_secret,
         )
-        session = requests.Session()
-        session.headers['Authorization'] = 'Bearer {}'.format(oauth_access_token)
-        session.headers['content-type'] = 'application/json'
-        self.session = session
+        if expires_at is None:
+            _OAUTH_ACCESS_TOKENS.pop(self.enterprise_configuration.id, None)
+        else:
+            expires_at -= OAUTH_ACCESS_TOKEN_EXPIRY_MARGIN
+            _OAUTH_ACCESS_TOKENS[self.enterprise_configuration.id] = (oauth_access_token, expires_at)
+        return oauth_access_token, expires_at
 
     def _update_course_details(self, course_id, serialized_data):
         """
@@ -265,25 +323,67 @@ class CanvasAPIClient(IntegratedChannelApiClient):
 
         return integration_id
 
+    def _get_course_ids_cache_key(self):
+        """
+        Return the cache key of the Canvas course IDs by integration ID for this client's configuration.
+        """
+        return get_cache_key(
+            resource='canvas_course_ids',
+            enterprise_configuration_id=self.enterprise_configuration.id,
+        )
+
+    def _request_course(self, integration_id, send_request):
+        """
+        Send a request about the Canvas course with the given integration ID and return its result.
+
+        The remembered course IDs go stale when a course is deleted or recreated in Canvas outside this client.
+        If Canvas answers 404, they are forgotten and the request is sent once more to the course ID looked up
+        again.
+
+        Args:
+            integration_id (string): The ID retrieved from the transmission payload.
+            send_request (callable): Sends the request, given the Canvas course ID.
+        """
+        course_id = self._get_course_id_from_integration_id(integration_id)
+        try:
+            return send_request(course_id)
+        except requests.exceptions.HTTPError as error:
+            if error.response is None or error.response.status_code != 404:
+                raise
+
+        self.course_ids_by_integration_id = None
+        cache.delete(self._get_course_ids_cache_key())
+        return send_request(self._get_course_id_from_integration_id(integration_id))
+
     def _get_course_id_from_integration_id(self, integration_id):
         """
         To obtain course ID we have to request all courses associated with the integrated
         account and match the one with our integration ID.
 
+        The courses are requested once and remembered by integration ID, both on the client and in the
+        cache, so that neither a transmission updating or deleting many courses nor the next scheduled
+        transmission requests them all again for each course. They are requested again if the integration
+        ID is not among them, in case its course was created in the meantime.
+
         Args:
             integration_id (string): The ID retrieved from the transmission payload.
         """
-        url = "{}/api/v1/accounts/{}/courses/".format(
-            self.enterprise_configuration.canvas_base_url,
-            self.enterprise_configuration.canvas_account_id
-        )
-        all_courses_response = self.session.get(url).json()
-        course_id = None
-        for course in all_courses_response:
-            if course['integration_id'] == integration_id:
-                course_id = course['id']
-                break
+        cache_key = self._get_course_ids_cache_key()
+        if self.course_ids_by_integration_id is None:
+            self.course_ids_by_integration_id = cache.get(cache_key)
+
+        if self.course_ids_by_integration_id is None or integration_id not in self.course_ids_by_integration_id:
+            url = "{}/api/v1/accounts/{}/courses/".format(
+                self.enterprise_configuration.canvas_base_url,
+                self.enterprise_configuration.canvas_account_id
+            )
+            all_courses_response = self.session.get(url).json()
+            self.course_ids_by_integration_id = {
+                course['integration_id']: course['id'] for course in all_courses_response
+            }
+            cache.set(cache_key, self.course_ids_by_integration_id, settings.ENTERPRISE_API_CACHE_TIMEOUT)
 
+        course_id = self.course_ids_by_integration_id.get(integration_id)
         if not course_id:
             raise CanvasClientError("No Canvas courses found with associated integration ID: {}.".format(
                 integration_id
@@ -392,7 +492,8 @@ class CanvasAPIClient(IntegratedChannelApiClient):
             client_secret (str): API client secret
 
         Returns:
-            access_token (str): the OAuth access token to access the Canvas API as the user
+            tuple: Tuple containing access token string and expiration datetime, which is None when Canvas
+            does not report the token's lifetime.
         Raises:
             HTTPError: If we received a failure response code from Canvas.
             RequestException: If an unexpected response format was received that we could not parse.
@@ -423,6 +524,9 @@ class CanvasAPIClient(IntegratedChannelApiClient):
         auth_response.raise_for_status()
         try:
             data = auth_response.json()
-            return data['access_token']
+            expires_at = None
+            if 'expires_in' in data:
+                expires_at = datetime.datetime.utcfromtimestamp(data['expires_in'] + int(time.time()))
+            return data['access_token'], expires_at
         except (KeyError, ValueError):
             raise requests.RequestException(response=auth_response)
@@ -34,6 +34,16 @@ class CornerstoneAPIClient(IntegratedChannelApiClient):
         self.session = None
         self.expires_at = None
 
+    def _create_session(self):
+        """
+        Instantiate a new session object for use in connecting with Cornerstone.
+
+        The session is kept for the life of the client, so that the completions sent in one transmission
+        share a pooled connection rather than opening a new one each.
+        """
+        if self.session is None:
+            self.session = requests.Session()
+
     def create_content_metadata(self, serialized_data):
         """
         Create content metadata using the Cornerstone course content API.
@@ -75,7 +85,8 @@ class CornerstoneAPIClient(IntegratedChannelApiClient):
             session_token=session_token,
         )
 
-        response = requests.post(
+        self._create_session()
+        response = self.session.post(
             url,
             json=[json_payload['data']],
             headers={
@@ -71,6 +71,7 @@ class ContentMetadataExporter(Exporter):
         super(ContentMetadataExporter, self).__init__(user, enterprise_configuration)
         self.enterprise_api = EnterpriseApiClient(self.user)
         self.enterprise_catalog_api = EnterpriseCatalogApiClient(self.user)
+        self._transformers_by_content_type = {}
 
     def export(self, **kwargs):
         """
@@ -103,28 +104,10 @@ class ContentMetadataExporter(Exporter):
         Transform the provided content metadata item to the schema expected by the integrated channel.
         """
         content_metadata_type = content_metadata_item[ContentType.METADATA_KEY]
+        transformers = self._get_transformers(content_metadata_type)
         transformed_item = {}
         for integrated_channel_schema_key, edx_data_schema_key in self.DATA_TRANSFORM_MAPPING.items():
-            # Look for transformer functions defined on subclasses.
-            # Favor content type-specific functions.
-            transformer = (
-                getattr(
-                    self,
-                    'transform_{content_type}_{edx_data_schema_key}'.format(
-                        content_type=content_metadata_type,
-                        edx_data_schema_key=edx_data_schema_key
-                    ),
-                    None
-                )
-                or
-                getattr(
-                    self,
-                    'transform_{edx_data_schema_key}'.format(
-                        edx_data_schema_key=edx_data_schema_key
-                    ),
-                    None
-                )
-            )
+            transformer = transformers[edx_data_schema_key]
             if transformer:
                 transformed_value = transformer(content_metadata_item)  # pylint: disable=not-callable
             else:
@@ -150,6 +133,40 @@ class ContentMetadataExporter(Exporter):
 
         return transformed_item
 
+    def _get_transformers(self, content_metadata_type):
+        """
+        Return the transformer function, or None, of each edX data schema key for the given content type.
+
+        The transformers are looked up once per content type, instead of building their names for every field of
+        every exported content metadata item.
+        """
+        transformers = self._transformers_by_content_type.get(content_metadata_type)
+        if transformers is None:
+            transformers = {}
+            for edx_data_schema_key in self.DATA_TRANSFORM_MAPPING.values():
+                # Look for transformer functions defined on subclasses.
+                # Favor content type-specific functions.
+                transformers[edx_data_schema_key] = (
+                    getattr(
+                        self,
+                        'transform_{content_type}_{edx_data_schema_key}'.format(
+                            content_type=content_metadata_type,
+                            edx_data_schema_key=edx_data_schema_key
+                        ),
+                        None
+                    )
+                    or
+                    getattr(
+                        self,
+                        'transform_{edx_data_schema_key}'.format(
+                            edx_data_schema_key=edx_data_schema_key
+                        ),
+                        None
+                    )
+                )
+            self._transformers_by_content_type[content_metadata_type] = transformers
+        return transformers
+
 
 class ContentMetadataItemExport:
     """
@@ -71,7 +71,8 @@ class IntegratedChannelCommandMixin:
             filter_kwargs['enterprise_customer'] = enterprise_customer
 
         for channel_class in channel_classes:
-            for integrated_channel in channel_class.objects.filter(**filter_kwargs):
+            integrated_channels = channel_class.objects.select_related('enterprise_customer').filter(**filter_kwargs)
+            for integrated_channel in integrated_channels:
                 yield integrated_channel
 
     @staticmethod
@@ -32,7 +32,9 @@ def transmit_content_metadata(username, channel_code, channel_pk):
     """
     start = time.time()
     api_user = User.objects.get(username=username)
-    integrated_channel = INTEGRATED_CHANNEL_CHOICES[channel_code].objects.get(pk=channel_pk)
+    integrated_channel = INTEGRATED_CHANNEL_CHOICES[channel_code].objects.select_related(
+        'enterprise_customer'
+    ).get(pk=channel_pk)
     LOGGER.info('[Integrated Channel] Content metadata transmission started.'
                 ' Configuration: {configuration}'.format(configuration=integrated_channel))
     try:
@@ -67,7 +69,9 @@ def transmit_learner_data(username, channel_code, channel_pk):
     """
     start = time.time()
     api_user = User.objects.get(username=username)
-    integrated_channel = INTEGRATED_CHANNEL_CHOICES[channel_code].objects.get(pk=channel_pk)
+    integrated_channel = INTEGRATED_CHANNEL_CHOICES[channel_code].objects.select_related(
+        'enterprise_customer'
+    ).get(pk=channel_pk)
     LOGGER.info('[Integrated Channel] Batch processing learners for integrated channel.'
                 ' Configuration: {configuration}'.format(configuration=integrated_channel))
 
@@ -102,10 +106,9 @@ def transmit_single_learner_data(username, course_run_id):
     enterprise_customer = get_enterprise_customer_for_user(user)
     channel_utils = IntegratedChannelCommandUtils()
     # Transmit the learner data to each integrated channelStarting Export
-    for channel in channel_utils.get_integrated_channels(
+    for integrated_channel in channel_utils.get_integrated_channels(
             {'channel': None, 'enterprise_customer': enterprise_customer.uuid}
     ):
-        integrated_channel = INTEGRATED_CHANNEL_CHOICES[channel.channel_code()].objects.get(pk=channel.pk)
         LOGGER.info(
             '[Integrated Channel] Processing learner for transmission. Configuration: {configuration},'
             ' User: {user_id}'.format(
@@ -139,7 +142,9 @@ def unlink_inactive_learners(channel_code, channel_pk):
 
     """
     start = time.time()
-    integrated_channel = INTEGRATED_CHANNEL_CHOICES[channel_code].objects.get(pk=channel_pk)
+    integrated_channel = INTEGRATED_CHANNEL_CHOICES[channel_code].objects.select_related(
+        'enterprise_customer'
+    ).get(pk=channel_pk)
     LOGGER.info('Processing learners to unlink inactive users using configuration: [%s]', integrated_channel)
 
     # Note: learner data transmission code paths don't raise any uncaught exception, so we don't need a broad
@@ -7,10 +7,9 @@ import json
 import logging
 from itertools import islice
 
-from jsondiff import diff
-
 from django.apps import apps
 from django.conf import settings
+from django.utils.timezone import now
 
 from integrated_channels.exceptions import ClientError
 from integrated_channels.integrated_channel.client import IntegratedChannelApiClient
@@ -19,6 +18,10 @@ from integrated_channels.utils import chunks
 
 LOGGER = logging.getLogger(__name__)
 
+# Rows per UPDATE statement when saving transmissions, so that the statement size does not grow with the
+# configured transmission chunk size.
+TRANSMISSION_UPDATE_BATCH_SIZE = 100
+
 
 class ContentMetadataTransmitter(Transmitter):
     """
@@ -69,7 +72,7 @@ class ContentMetadataTransmitter(Transmitter):
             channel_metadata = item.channel_metadata
             transmitted_item = transmission_map.get(content_id, None)
             if transmitted_item is not None:
-                if diff(channel_metadata, transmitted_item.channel_metadata):
+                if channel_metadata != transmitted_item.channel_metadata:
                     items_to_update[content_id] = channel_metadata
             else:
                 items_to_create[content_id] = channel_metadata
@@ -222,10 +225,24 @@ class ContentMetadataTransmitter(Transmitter):
         """
         Update ContentMetadataItemTransmission models for the given content metadata items.
         """
+        # pylint: disable=invalid-name
+        ContentMetadataItemTransmission = apps.get_model(
+            'integrated_channel',
+            'ContentMetadataItemTransmission'
+        )
+        modified = now()
+        transmissions = []
         for content_id, channel_metadata in content_metadata_item_map.items():
             transmission = transmission_map[content_id]
             transmission.channel_metadata = channel_metadata
-            transmission.save()
+            # bulk_update does not apply auto_now, so modified is set by hand.
+            transmission.modified = modified
+            transmissions.append(transmission)
+        ContentMetadataItemTransmission.objects.bulk_update(
+            transmissions,
+            ['channel_metadata', 'modified'],
+            batch_size=TRANSMISSION_UPDATE_BATCH_SIZE,
+        )
 
     def _delete_transmissions(self, content_metadata_item_ids):
         """
@@ -28,6 +28,7 @@ from six.moves.urllib.parse import (  # pylint: disable=import-error,ungrouped-i
 )
 
 from django.conf import settings
+from django.core.cache import cache
 from django.shortcuts import render
 from django.test import TestCase
 from django.test.client import RequestFactory
@@ -263,6 +264,9 @@ class APITest(APITestCase):
         Perform operations common to all tests.
         """
         super(APITest, self).setUp()
+        # Start every test with an empty cache so throttling history and cached API responses
+        # from earlier tests cannot leak into it.
+        cache.clear()
         self.create_user(username=TEST_USERNAME, email=TEST_EMAIL, password=TEST_PASSWORD)
         self.client = APIClient()
         self.client.login(username=TEST_USERNAME, password=TEST_PASSWORD)
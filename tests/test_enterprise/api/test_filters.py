@@ -4,12 +4,15 @@ Tests for the `edx-enterprise` filters module.
 """
 
 import ddt
+from django_filters.rest_framework import DjangoFilterBackend
 from pytest import mark
 from rest_framework import status
 from rest_framework.reverse import reverse
 
 from django.conf import settings
 
+from enterprise.api.v1.views import EnterpriseCustomerUserViewSet
+from enterprise.models import EnterpriseCustomerUser
 from test_utils import FAKE_UUIDS, TEST_EMAIL, TEST_USERNAME, APITest, factories
 
 ENTERPRISE_CUSTOMER_LIST_ENDPOINT = reverse('enterprise-customer-list')
@@ -171,3 +174,35 @@ class TestEnterpriseLinkedUserFilterBackend(APITest):
                 assert enterprise_customer_response[key] == value
         else:
             assert response == {'count': 0, 'next': None, 'previous': None, 'results': []}
+
+
+@mark.django_db
+class TestGetFiltersetClass(APITest):
+    """
+    Test suite for the ``get_filterset_class`` helper.
+    """
+
+    def test_filterset_class(self):
+        """
+        Make sure the view's prebuilt filter class filters the view's queryset by its fields.
+        """
+        self.user.is_staff = True
+        self.user.save()
+        enterprise_customer = factories.EnterpriseCustomerFactory(uuid=FAKE_UUIDS[0])
+        factories.EnterpriseCustomerUserFactory(enterprise_customer=enterprise_customer)
+        factories.EnterpriseCustomerUserFactory()
+
+        response = self.client.get(
+            settings.TEST_SERVER + reverse('enterprise-learner-list'),
+            {'enterprise_customer': FAKE_UUIDS[0]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = self.load_json(response.content)
+        assert [learner['enterprise_customer']['uuid'] for learner in data['results']] == [FAKE_UUIDS[0]]
+
+        filterset_class = DjangoFilterBackend().get_filterset_class(
+            EnterpriseCustomerUserViewSet(),
+            EnterpriseCustomerUser.objects.all(),
+        )
+        assert filterset_class is EnterpriseCustomerUserViewSet.filterset_class
+        assert list(filterset_class.base_filters) == ['enterprise_customer', 'user_id', 'active']
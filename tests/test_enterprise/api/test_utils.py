@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the `edx-enterprise` api utils module.
+"""
+
+from pytest import mark
+
+from django.test import TestCase
+
+from enterprise.api.utils import (
+    get_ent_cust_from_report_config_uuid,
+    get_enterprise_customer_from_catalog_id,
+    get_enterprise_customer_from_user_id,
+)
+from test_utils import FAKE_UUIDS, factories
+
+
+@mark.django_db
+class TestEnterpriseCustomerLookups(TestCase):
+    """
+    Test the helpers which look up the enterprise customer of an object for permission checks.
+    """
+
+    def setUp(self):
+        super(TestEnterpriseCustomerLookups, self).setUp()
+        self.enterprise_customer = factories.EnterpriseCustomerFactory(uuid=FAKE_UUIDS[0])
+
+    def test_get_enterprise_customer_from_catalog_id(self):
+        catalog = factories.EnterpriseCustomerCatalogFactory(enterprise_customer=self.enterprise_customer)
+        with self.assertNumQueries(1):
+            assert get_enterprise_customer_from_catalog_id(catalog.uuid) == FAKE_UUIDS[0]
+        assert get_enterprise_customer_from_catalog_id(FAKE_UUIDS[1]) is None
+
+    def test_get_ent_cust_from_report_config_uuid(self):
+        reporting_config = factories.EnterpriseCustomerReportingConfigFactory(
+            enterprise_customer=self.enterprise_customer,
+        )
+        with self.assertNumQueries(1):
+            assert get_ent_cust_from_report_config_uuid(reporting_config.uuid) == FAKE_UUIDS[0]
+        assert get_ent_cust_from_report_config_uuid(FAKE_UUIDS[1]) is None
+
+    def test_get_enterprise_customer_from_user_id(self):
+        enterprise_customer_user = factories.EnterpriseCustomerUserFactory(
+            enterprise_customer=self.enterprise_customer,
+        )
+        with self.assertNumQueries(1):
+            assert get_enterprise_customer_from_user_id(enterprise_customer_user.user_id) == FAKE_UUIDS[0]
+        assert get_enterprise_customer_from_user_id(enterprise_customer_user.user_id + 1) is None
@@ -6,13 +6,13 @@ Tests for the `edx-enterprise` api module.
 import json
 import uuid
 from operator import itemgetter
-from smtplib import SMTPException
 
 import ddt
 import mock
 from pytest import mark, raises
 from rest_framework import status
 from rest_framework.reverse import reverse
+from rest_framework.settings import api_settings
 from rest_framework.test import APIClient
 from six.moves.urllib.parse import (  # pylint: disable=import-error,ungrouped-imports
     parse_qs,
@@ -22,11 +22,16 @@ from six.moves.urllib.parse import (  # pylint: disable=import-error,ungrouped-i
     urlunsplit,
 )
 
+from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.models import Permission
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+from enterprise.api.utils import get_enterprise_customer_from_user_id
+from enterprise.api.v1.views import EnterpriseCourseEnrollmentViewSet
 from enterprise.constants import (
     ALL_ACCESS_CONTEXT,
     ENTERPRISE_ADMIN_ROLE,
@@ -38,6 +43,7 @@ from enterprise.constants import (
 from enterprise.models import (
     EnterpriseCatalogQuery,
     EnterpriseCourseEnrollment,
+    EnterpriseCustomerCatalog,
     EnterpriseCustomerUser,
     EnterpriseEnrollmentSource,
     EnterpriseFeatureRole,
@@ -378,6 +384,28 @@ class TestEnterpriseAPIViews(APITest):
         response = self.load_json(response.content)
         assert expected_groups == response['results'][0]['groups']
 
+    def test_get_enterprise_customer_user_list_joins_enterprise_customer(self):
+        """
+        Ensure the learner list does not look up each learner's enterprise customer data separately.
+        """
+        self.user.is_staff = True
+        self.user.save()
+        for _ in range(3):
+            enterprise_customer = factories.EnterpriseCustomerFactory()
+            factories.EnterpriseCustomerBrandingConfigurationFactory(enterprise_customer=enterprise_customer)
+            factories.EnterpriseCustomerUserFactory(enterprise_customer=enterprise_customer)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(settings.TEST_SERVER + ENTERPRISE_LEARNER_LIST_ENDPOINT)
+        response = self.load_json(response.content)
+
+        assert response['count'] == 3
+        joined_tables = ('django_site', 'enterprise_enterprisecustomerbrandingconfiguration')
+        assert not [
+            query for query in queries.captured_queries
+            if any('FROM "{}"'.format(table) in query['sql'] for table in joined_tables)
+        ]
+
     @override_settings(ECOMMERCE_SERVICE_WORKER_USERNAME=TEST_USERNAME)
     @ddt.data(
         (True, 201),
@@ -482,6 +510,25 @@ class TestEnterpriseAPIViews(APITest):
                     user_id=user.id, enterprise_customer=enterprise_customer, active=user.is_active
                 )
 
+    def test_post_pending_enterprise_customer_user_invalid_enterprise_customer(self):
+        """
+        Make sure a malformed enterprise customer UUID is reported as a validation error.
+        """
+        client_username = 'client_username'
+        self.client.logout()
+        self.create_user(username=client_username, password=TEST_PASSWORD, is_staff=True)
+        self.client.login(username=client_username, password=TEST_PASSWORD)
+        factories.UserFactory(email='newuser@example.com')
+
+        data = {
+            'enterprise_customer': 'not-a-uuid',
+            'user_email': 'newuser@example.com',
+        }
+        response = self.client.post(settings.TEST_SERVER + PENDING_ENTERPRISE_LEARNER_LIST_ENDPOINT, data=data)
+
+        assert response.status_code == 400
+        assert 'enterprise_customer' in self.load_json(response.content)
+
     def test_post_pending_enterprise_customer_user_logged_out(self):
         """
         Make sure users can't post PendingEnterpriseCustomerUsers when logged out.
@@ -651,6 +698,41 @@ class TestEnterpriseAPIViews(APITest):
         response = self.load_json(response.content)
         assert sorted(expected_json, key=sorting_key) == sorted(response['results'], key=sorting_key)
 
+    def test_enterprise_course_enrollment_list_cursor_pagination(self):
+        """
+        Make sure the enrollments can be paged through by cursor on request.
+        """
+        self.user.is_staff = True
+        self.user.save()
+        course_ids = ['course-v1:edX+DemoX+Demo_Course_{}'.format(index) for index in range(3)]
+        for course_id in course_ids:
+            factories.EnterpriseCourseEnrollmentFactory(course_id=course_id)
+
+        response = self.load_json(self.client.get(
+            settings.TEST_SERVER + ENTERPRISE_COURSE_ENROLLMENT_LIST_ENDPOINT + '?pagination=cursor&page_size=2'
+        ).content)
+        assert 'count' not in response
+        assert response['previous'] is None
+        first_page_course_ids = [enrollment['course_id'] for enrollment in response['results']]
+
+        response = self.load_json(self.client.get(response['next']).content)
+        assert response['next'] is None
+        second_page_course_ids = [enrollment['course_id'] for enrollment in response['results']]
+
+        assert first_page_course_ids + second_page_course_ids == course_ids
+
+        # Page numbers stay the default.
+        response = self.load_json(self.client.get(
+            settings.TEST_SERVER + ENTERPRISE_COURSE_ENROLLMENT_LIST_ENDPOINT
+        ).content)
+        assert response['count'] == 3
+
+    def test_enterprise_course_enrollment_pagination_class_without_request(self):
+        """
+        Make sure the enrollment view falls back to page numbers when it has no request, e.g. during schema generation.
+        """
+        assert EnterpriseCourseEnrollmentViewSet().pagination_class == api_settings.DEFAULT_PAGINATION_CLASS
+
     def test_enterprise_customer_basic_list(self):
         """
             Test basic list endpoint of enterprise_customers
@@ -680,6 +762,31 @@ class TestEnterpriseAPIViews(APITest):
         response = self.client.get(url, {'startswith': startswith})
         assert startswith_enterprise_customers == self.load_json(response.content)
 
+    def test_enterprise_customer_basic_list_cached(self):
+        """
+        Ensure basic list responses are served from the cache until an enterprise customer changes.
+        """
+        url = urljoin(settings.TEST_SERVER, ENTERPRISE_CUSTOMER_BASIC_LIST_ENDPOINT)
+        enterprise_customer = factories.EnterpriseCustomerFactory(name='Acme')
+        expected_response = [{'id': str(enterprise_customer.uuid), 'name': 'Acme'}]
+
+        response = self.client.get(url, {'startswith': 'ac'})
+        assert expected_response == self.load_json(response.content)
+
+        # only the session user is loaded; the enterprise customers come from the cache
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {'startswith': 'ac'})
+        assert expected_response == self.load_json(response.content)
+
+        enterprise_customer.name = 'Acme Inc.'
+        enterprise_customer.save()
+        response = self.client.get(url, {'startswith': 'ac'})
+        assert [{'id': str(enterprise_customer.uuid), 'name': 'Acme Inc.'}] == self.load_json(response.content)
+
+        enterprise_customer.delete()
+        response = self.client.get(url, {'startswith': 'ac'})
+        assert [] == self.load_json(response.content)
+
     @ddt.data(
         # Request missing required permissions query param.
         (True, False, [], {}, False, {'detail': 'User is not allowed to access the view.'}),
@@ -800,6 +907,34 @@ class TestEnterpriseAPIViews(APITest):
         else:
             assert response == expected_error
 
+    def test_enterprise_customer_with_access_to_joins_related_data(self):
+        """
+        ``with_access_to`` should not query the site or branding configuration of each listed customer separately.
+        """
+        self.user.is_staff = True
+        self.user.save()
+        group = factories.GroupFactory(name='enterprise_enrollment_api_access')
+        group.user_set.add(self.user)
+        for index in range(3):
+            enterprise_customer = factories.EnterpriseCustomerFactory(name='Test Enterprise {}'.format(index))
+            factories.EnterpriseCustomerBrandingConfigurationFactory(enterprise_customer=enterprise_customer)
+
+        query_params = {'permissions': ['enterprise_enrollment_api_access'], 'search': 'Test Enterprise'}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                settings.TEST_SERVER + ENTERPRISE_CUSTOMER_WITH_ACCESS_TO_ENDPOINT + '?' + urlencode(query_params, True)
+            )
+        response = self.load_json(response.content)
+
+        assert [customer['name'] for customer in response['results']] == [
+            'Test Enterprise 0', 'Test Enterprise 1', 'Test Enterprise 2',
+        ]
+        joined_tables = ('django_site', 'enterprise_enterprisecustomerbrandingconfiguration')
+        assert not [
+            query for query in queries.captured_queries
+            if any('FROM "{}"'.format(table) in query['sql'] for table in joined_tables)
+        ]
+
     def test_enterprise_customer_branding_detail(self):
         """
         ``enterprise_customer_branding``'s get endpoint should get the config by looking up the enterprise slug and
@@ -837,6 +972,26 @@ class TestEnterpriseAPIViews(APITest):
         response = self.load_json(response.content)
         assert expected_item == response
 
+    def test_enterprise_customer_branding_list_joins_enterprise_customer(self):
+        """
+        Ensure the branding list does not look up each configuration's enterprise customer separately.
+        """
+        self.user.is_staff = True
+        self.user.save()
+        for _ in range(3):
+            factories.EnterpriseCustomerBrandingConfigurationFactory()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(settings.TEST_SERVER + ENTERPRISE_CUSTOMER_BRANDING_LIST_ENDPOINT)
+        response = self.load_json(response.content)
+
+        assert response['count'] == 3
+        assert all(branding_configuration['enterprise_slug'] for branding_configuration in response['results'])
+        assert not [
+            query for query in queries.captured_queries
+            if 'FROM "enterprise_enterprisecustomer"' in query['sql']
+        ]
+
     @ddt.data(
         (False, False),
         (False, True),
@@ -1161,6 +1316,60 @@ class TestEnterpriseAPIViews(APITest):
 
         assert response_json['contains_content_items'] == contains_content_items
 
+    @mock.patch('enterprise.api_client.discovery.CourseCatalogApiServiceClient')
+    def test_enterprise_catalog_contains_content_items_unencoded_plus(self, mock_catalog_api_client):
+        """
+        Ensure plus characters sent unencoded in course run keys are not read as spaces.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory(uuid=FAKE_UUIDS[0])
+        factories.EnterpriseCustomerCatalogFactory(
+            uuid=FAKE_UUIDS[1],
+            enterprise_customer=enterprise_customer,
+            content_filter={'key': ['course-v1:edX+DemoX+Demo_Course']},
+        )
+        mock_catalog_api_client.return_value = mock.Mock(
+            get_catalog_results=mock.Mock(return_value={})
+        )
+
+        response = self.client.get(
+            ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT + '?course_run_ids=course-v1:edX+DemoX+Demo_Course'
+        )
+        response_json = self.load_json(response.content)
+
+        assert response_json['contains_content_items'] is True
+
+    @mock.patch('enterprise.api_client.discovery.CourseCatalogApiServiceClient')
+    def test_enterprise_catalog_contains_content_items_cached(self, mock_catalog_api_client):
+        """
+        Ensure contains_content_items answers repeated checks from the cache until the catalog changes.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory(uuid=FAKE_UUIDS[0])
+        catalog = factories.EnterpriseCustomerCatalogFactory(
+            uuid=FAKE_UUIDS[1],
+            enterprise_customer=enterprise_customer,
+            content_filter={'key': [fake_catalog_api.FAKE_COURSE_RUN['key'], fake_catalog_api.FAKE_COURSE_RUN2['key']]},
+        )
+        mock_catalog_api_client.return_value = mock.Mock(
+            get_catalog_results=mock.Mock(return_value={})
+        )
+        course_run_ids = [fake_catalog_api.FAKE_COURSE_RUN['key'], fake_catalog_api.FAKE_COURSE_RUN2['key']]
+
+        for query_course_run_ids in (course_run_ids, list(reversed(course_run_ids))):
+            response = self.client.get(
+                ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT + '?' +
+                urlencode({'course_run_ids': query_course_run_ids}, True)
+            )
+            assert self.load_json(response.content)['contains_content_items'] is True
+        assert mock_catalog_api_client.call_count == 1
+
+        catalog.content_filter = {'key': [fake_catalog_api.FAKE_COURSE_RUN['key']]}
+        catalog.save()
+        response = self.client.get(
+            ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT + '?' + urlencode({'course_run_ids': course_run_ids}, True)
+        )
+        assert self.load_json(response.content)['contains_content_items'] is False
+        assert mock_catalog_api_client.call_count == 2
+
     def test_enterprise_catalog_contains_content_items_no_query_params(self):
         """
         Ensure contains_content_items endpoint returns error message
@@ -1463,6 +1672,72 @@ class TestEnterpriseAPIViews(APITest):
 
         assert response_json['contains_content_items'] == contains_content_items
 
+    @mock.patch('enterprise.api_client.discovery.CourseCatalogApiServiceClient')
+    def test_enterprise_customer_contains_content_items_catalog_queries_fetched_once(self, mock_catalog_api_client):
+        """
+        Ensure contains_content_items endpoint does not query each catalog's EnterpriseCatalogQuery separately.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory(uuid=FAKE_UUIDS[0])
+        for _ in range(3):
+            factories.EnterpriseCustomerCatalogFactory(
+                enterprise_customer=enterprise_customer,
+                enterprise_catalog_query=factories.EnterpriseCatalogQueryFactory(),
+            )
+
+        mock_catalog_api_client.return_value = mock.Mock(
+            get_catalog_results=mock.Mock(return_value={'results': []})
+        )
+
+        query_params = {'program_uuids': [fake_catalog_api.FAKE_SEARCH_ALL_PROGRAM_RESULT_1['uuid']]}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                ENTERPRISE_CUSTOMER_CONTAINS_CONTENT_ENDPOINT + '?' + urlencode(query_params, True)
+            )
+        response_json = self.load_json(response.content)
+
+        assert response_json['contains_content_items'] is False
+        catalog_query_table = EnterpriseCatalogQuery._meta.db_table  # pylint: disable=protected-access
+        assert not [
+            query for query in queries.captured_queries
+            if 'FROM "{}"'.format(catalog_query_table) in query['sql']
+        ]
+        # the catalogs themselves are read once, without loading deferred fields afterwards
+        catalog_table = EnterpriseCustomerCatalog._meta.db_table  # pylint: disable=protected-access
+        assert len([
+            query for query in queries.captured_queries
+            if 'FROM "{}"'.format(catalog_table) in query['sql']
+        ]) == 1
+
+    @mock.patch('enterprise.api_client.discovery.CourseCatalogApiServiceClient')
+    def test_enterprise_customer_contains_content_items_same_content_filter_checked_once(
+            self,
+            mock_catalog_api_client,
+    ):
+        """
+        Ensure catalogs sharing a content filter are only checked against the discovery service once.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory(uuid=FAKE_UUIDS[0])
+        content_filter = {'content_type': 'course', 'partner': 'edx'}
+        for _ in range(2):
+            factories.EnterpriseCustomerCatalogFactory(
+                enterprise_customer=enterprise_customer,
+                content_filter=content_filter,
+            )
+        factories.EnterpriseCustomerCatalogFactory(
+            enterprise_customer=enterprise_customer,
+            content_filter={'content_type': 'program', 'partner': 'edx'},
+        )
+
+        get_catalog_results = mock.Mock(return_value={'results': []})
+        mock_catalog_api_client.return_value = mock.Mock(get_catalog_results=get_catalog_results)
+
+        query_params = {'program_uuids': [fake_catalog_api.FAKE_SEARCH_ALL_PROGRAM_RESULT_1['uuid']]}
+        response = self.client.get(ENTERPRISE_CUSTOMER_CONTAINS_CONTENT_ENDPOINT + '?' + urlencode(query_params, True))
+        response_json = self.load_json(response.content)
+
+        assert response_json['contains_content_items'] is False
+        assert get_catalog_results.call_count == 2
+
     def test_enterprise_customer_contains_content_items_no_catalogs(self):
         """
         Ensure contains_content_items endpoint returns False when the EnterpriseCustomer
@@ -2111,6 +2386,28 @@ class TestEnterpriseAPIViews(APITest):
         assert response.status_code == 200
         assert response.json() == expected_content_filter
 
+    def test_get_catalog_query_not_modified(self):
+        """
+        Test that `CatalogQueryView` answers a conditional request with 304 until the catalog query is modified.
+        """
+        catalog_query = EnterpriseCatalogQuery.objects.create(
+            title='Test Catalog Query',
+            content_filter={'partner': 'MushiX'}
+        )
+        url = settings.TEST_SERVER + reverse('enterprise-catalog-query', kwargs={'catalog_query_id': catalog_query.id})
+        etag = self.client.get(url)['ETag']
+
+        # One query for the session user and one for the catalog query's modified timestamp.
+        with self.assertNumQueries(2):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+        catalog_query.content_filter = {'partner': 'edx'}
+        catalog_query.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.json() == {'partner': 'edx'}
+
     def test_get_catalog_query_not_found(self):
         """
         Test that `CatalogQueryView` returns correct response when enterprise catalog query is not found.
@@ -2231,21 +2528,6 @@ class TestEnterpriseAPIViews(APITest):
             u'johndoe@unknown.com from Oracle has requested 50 additional codes. Please reach out to them.'
             u'\nAdditional Notes:\nHere are helping notes.'.encode("unicode_escape").decode("utf-8")
         ),
-        (
-            # Email send issue
-            {
-                'email': 'johndoe@unknown.com',
-                'enterprise_name': 'Oracle',
-                'number_of_codes': '50',
-                'notes': 'Here are helping notes',
-            },
-            {u'error': u'Request codes email could not be sent'},
-            500,
-            SMTPException(),
-            True,
-            u'johndoe@unknown.com from Oracle has requested 50 additional codes. Please reach out to them.'
-            u'\nAdditional Notes:\nHere are helping notes.'.encode("unicode_escape").decode("utf-8")
-        )
     )
     @ddt.unpack
     def test_post_request_codes(
@@ -2279,6 +2561,34 @@ class TestEnterpriseAPIViews(APITest):
         else:
             mock_send_mail.assert_not_called()
 
+    @mock.patch('enterprise.api.v1.views.send_coupon_codes_request_email')
+    def test_post_request_codes_email_enqueued(self, mock_send_email_task):
+        """
+        Ensure the endpoint enqueues the codes request email and answers 200 without waiting for it to be sent.
+        """
+        post_data = {
+            'email': 'johndoe@unknown.com',
+            'enterprise_name': 'Oracle',
+            'number_of_codes': '50',
+            'notes': 'Here are helping notes',
+        }
+        response = self.client.post(
+            settings.TEST_SERVER + reverse('request-codes'),
+            data=json.dumps(post_data),
+            content_type='application/json',
+        )
+
+        assert response.status_code == 200
+        self.assertDictEqual(post_data, self.load_json(response.content))
+        app_config = apps.get_app_config('enterprise')
+        mock_send_email_task.delay.assert_called_once_with(
+            'Code Management - Request for Codes by Oracle',
+            mock.ANY,
+            app_config.enterprise_integrations_email,
+            [app_config.customer_success_email],
+        )
+        mock_send_email_task.assert_not_called()
+
     @mock.patch('enterprise.rules.crum.get_current_request')
     @mock.patch('django.core.mail.send_mail', mock.Mock(return_value={'status_code': status.HTTP_200_OK}))
     @ddt.data(
@@ -2330,12 +2640,12 @@ class TestEnterpriseAPIViews(APITest):
     )
     @ddt.unpack
     @mock.patch('enterprise.api.v1.views.EnrollmentApiClient')
-    @mock.patch('enterprise.api.v1.views.get_certificate_for_user')
+    @mock.patch('enterprise.api.v1.views.get_certificates_for_user')
     @mock.patch('enterprise.api.v1.views.get_course_overviews')
     def test_post_licensed_course_enrollments_license_revoke(
             self,
             mock_get_overviews,
-            mock_get_certificate,
+            mock_get_certificates,
             mock_enrollment_client,
             has_permissions,
             is_completed,
@@ -2372,7 +2682,9 @@ class TestEnterpriseAPIViews(APITest):
         })
 
         mock_get_overviews.return_value = [mock_get_overviews_response]
-        mock_get_certificate.return_value = {'is_passing': False}
+        mock_get_certificates.return_value = [
+            {'course_key': enterprise_course_enrollment.course_id, 'is_passing': False},
+        ]
         mock_enrollment_client.return_value = mock.Mock(
             update_course_enrollment_mode_for_user=mock.Mock(),
         )
@@ -2394,6 +2706,227 @@ class TestEnterpriseAPIViews(APITest):
         assert enterprise_course_enrollment.saved_for_later == is_revoked
         assert licensed_course_enrollment.is_revoked == is_revoked
 
+    @mock.patch('enterprise.api.v1.views.EnrollmentApiClient')
+    @mock.patch('enterprise.api.v1.views.get_certificates_for_user')
+    @mock.patch('enterprise.api.v1.views.get_course_overviews')
+    def test_post_licensed_course_enrollments_license_revoke_no_enrollments(
+            self,
+            mock_get_overviews,
+            mock_get_certificates,
+            mock_enrollment_client,
+    ):
+        """
+        Ensure no course overviews are requested when the user has no licensed enrollments.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        factories.EnterpriseCustomerUserFactory(
+            user_id=self.user.id,
+            enterprise_customer=enterprise_customer,
+        )
+
+        response = self.client.post(
+            settings.TEST_SERVER + LICENSED_ENTERPISE_COURSE_ENROLLMENTS_REVOKE_ENDPOINT,
+            data={'user_id': self.user.id, 'enterprise_id': enterprise_customer.uuid},
+        )
+
+        assert response.status_code == 204
+        mock_get_overviews.assert_not_called()
+        mock_get_certificates.assert_not_called()
+        mock_enrollment_client.assert_not_called()
+
+    @mock.patch('enterprise.api.v1.views.EnrollmentApiClient')
+    @mock.patch('enterprise.api.v1.views.get_certificates_for_user')
+    @mock.patch('enterprise.api.v1.views.get_course_overviews')
+    def test_post_licensed_course_enrollments_license_revoke_previously_revoked(
+            self,
+            mock_get_overviews,
+            mock_get_certificates,
+            mock_enrollment_client,
+    ):
+        """
+        Ensure licensed enrollments revoked before are moved to audit again, since they can be re-licensed and
+        upgraded without creating a new licensed enrollment.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        enterprise_course_enrollment = factories.EnterpriseCourseEnrollmentFactory(
+            enterprise_customer_user=factories.EnterpriseCustomerUserFactory(
+                user_id=self.user.id,
+                enterprise_customer=enterprise_customer,
+            ),
+        )
+        factories.LicensedEnterpriseCourseEnrollmentFactory(
+            enterprise_course_enrollment=enterprise_course_enrollment,
+            is_revoked=True,
+        )
+        mock_get_overviews.return_value = [{
+            'id': enterprise_course_enrollment.course_id,
+            'pacing': 'instructor',
+            'has_started': True,
+            'has_ended': False,
+        }]
+        mock_get_certificates.return_value = []
+
+        response = self.client.post(
+            settings.TEST_SERVER + LICENSED_ENTERPISE_COURSE_ENROLLMENTS_REVOKE_ENDPOINT,
+            data={'user_id': self.user.id, 'enterprise_id': enterprise_customer.uuid},
+        )
+
+        assert response.status_code == 204
+        mock_enrollment_client.return_value.update_course_enrollment_mode_for_user.assert_called_once_with(
+            username=self.user.username,
+            course_id=enterprise_course_enrollment.course_id,
+            mode='audit',
+        )
+
+    @mock.patch('enterprise.api.v1.views.EnrollmentApiClient')
+    @mock.patch('enterprise.api.v1.views.get_certificates_for_user')
+    @mock.patch('enterprise.api.v1.views.get_course_overviews')
+    def test_post_licensed_course_enrollments_license_revoke_history_user(
+            self,
+            mock_get_overviews,
+            mock_get_certificates,
+            mock_enrollment_client,  # pylint: disable=unused-argument
+    ):
+        """
+        Ensure the requesting user is recorded as the history user of the revoked enrollments.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        enterprise_course_enrollment = factories.EnterpriseCourseEnrollmentFactory(
+            enterprise_customer_user=factories.EnterpriseCustomerUserFactory(
+                user_id=self.user.id,
+                enterprise_customer=enterprise_customer,
+            ),
+        )
+        licensed_enrollment = factories.LicensedEnterpriseCourseEnrollmentFactory(
+            enterprise_course_enrollment=enterprise_course_enrollment,
+        )
+        mock_get_overviews.return_value = [{
+            'id': enterprise_course_enrollment.course_id,
+            'pacing': 'instructor',
+            'has_started': True,
+            'has_ended': False,
+        }]
+        mock_get_certificates.return_value = []
+
+        response = self.client.post(
+            settings.TEST_SERVER + LICENSED_ENTERPISE_COURSE_ENROLLMENTS_REVOKE_ENDPOINT,
+            data={'user_id': self.user.id, 'enterprise_id': enterprise_customer.uuid},
+        )
+
+        assert response.status_code == 204
+        assert licensed_enrollment.history.first().history_user == self.user
+        assert enterprise_course_enrollment.history.first().history_user == self.user
+
+    @mock.patch('enterprise.api.v1.views.EnrollmentApiClient')
+    @mock.patch('enterprise.api.v1.views.get_certificates_for_user')
+    @mock.patch('enterprise.api.v1.views.get_course_overviews')
+    def test_post_licensed_course_enrollments_license_revoke_partial_failure(
+            self,
+            mock_get_overviews,
+            mock_get_certificates,
+            mock_enrollment_client,
+    ):
+        """
+        Ensure enrollments moved to audit before an LMS failure are still revoked, and later ones are not.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        enterprise_customer_user = factories.EnterpriseCustomerUserFactory(
+            user_id=self.user.id,
+            enterprise_customer=enterprise_customer,
+        )
+        licensed_course_enrollments = [
+            factories.LicensedEnterpriseCourseEnrollmentFactory(
+                enterprise_course_enrollment=factories.EnterpriseCourseEnrollmentFactory(
+                    enterprise_customer_user=enterprise_customer_user,
+                    course_id=course_id,
+                ),
+            )
+            for course_id in ('course-v1:edX+DemoX+Demo_Course', 'course-v1:edX+DemoX+Other_Course')
+        ]
+
+        mock_get_overviews.return_value = [
+            {
+                'id': licensed_course_enrollment.enterprise_course_enrollment.course_id,
+                'pacing': 'instructor',
+                'has_started': True,
+                'has_ended': False,
+            }
+            for licensed_course_enrollment in licensed_course_enrollments
+        ]
+        mock_get_certificates.return_value = [
+            {'course_key': licensed_course_enrollment.enterprise_course_enrollment.course_id, 'is_passing': False}
+            for licensed_course_enrollment in licensed_course_enrollments
+        ]
+        mock_enrollment_client.return_value = mock.Mock(
+            update_course_enrollment_mode_for_user=mock.Mock(side_effect=[None, Exception('LMS is down')]),
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                settings.TEST_SERVER + LICENSED_ENTERPISE_COURSE_ENROLLMENTS_REVOKE_ENDPOINT,
+                data={'user_id': self.user.id, 'enterprise_id': enterprise_customer.uuid},
+            )
+
+        assert response.status_code == 500
+        # enterprise course enrollments are selected along with their licenses, never one at a time
+        assert not [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "enterprise_enterprisecourseenrollment"' in query['sql']
+        ]
+        for licensed_course_enrollment, is_revoked in zip(licensed_course_enrollments, (True, False)):
+            licensed_course_enrollment.refresh_from_db()
+            licensed_course_enrollment.enterprise_course_enrollment.refresh_from_db()
+            assert licensed_course_enrollment.is_revoked == is_revoked
+            assert licensed_course_enrollment.enterprise_course_enrollment.saved_for_later == is_revoked
+            assert licensed_course_enrollment.history.filter(is_revoked=True).exists() == is_revoked
+
+    @mock.patch('enterprise.api.v1.views.EnrollmentApiClient')
+    @mock.patch('enterprise.api.v1.views.get_certificates_for_user')
+    @mock.patch('enterprise.api.v1.views.get_course_overviews')
+    def test_post_licensed_course_enrollments_license_revoke_user_data_fetched_once(
+            self,
+            mock_get_overviews,
+            mock_get_certificates,
+            mock_enrollment_client,
+    ):
+        """
+        Ensure the learner's username and certificates are looked up once, however many enrollments are revoked.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        enterprise_customer_user = factories.EnterpriseCustomerUserFactory(
+            user_id=self.user.id,
+            enterprise_customer=enterprise_customer,
+        )
+        course_ids = ['course-v1:edX+DemoX+Demo_Course_{}'.format(index) for index in range(3)]
+        for course_id in course_ids:
+            factories.LicensedEnterpriseCourseEnrollmentFactory(
+                enterprise_course_enrollment=factories.EnterpriseCourseEnrollmentFactory(
+                    enterprise_customer_user=enterprise_customer_user,
+                    course_id=course_id,
+                ),
+            )
+
+        mock_get_overviews.return_value = [
+            {'id': course_id, 'pacing': 'instructor', 'has_started': True, 'has_ended': False}
+            for course_id in course_ids
+        ]
+        mock_get_certificates.return_value = [
+            {'course_key': course_id, 'is_passing': False} for course_id in course_ids
+        ]
+        mock_enrollment_client.return_value = mock.Mock(update_course_enrollment_mode_for_user=mock.Mock())
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                settings.TEST_SERVER + LICENSED_ENTERPISE_COURSE_ENROLLMENTS_REVOKE_ENDPOINT,
+                data={'user_id': self.user.id, 'enterprise_id': enterprise_customer.uuid},
+            )
+
+        assert response.status_code == 204
+        mock_get_certificates.assert_called_once_with(self.user.username)
+        # one query for the session user and the two made by a single ``EnterpriseCustomerUser.username``
+        user_queries = [query for query in queries.captured_queries if 'FROM "auth_user"' in query['sql']]
+        assert len(user_queries) == 3
+
 
 @ddt.ddt
 @mark.django_db
@@ -2621,6 +3154,43 @@ class TestEnterpriseReportingConfigAPIViews(APITest):
             response_content.pop('encrypted_password')
             self._assert_config_response(expected_data, response_content)
 
+    @mock.patch('enterprise.rules.crum.get_current_request')
+    def test_reporting_config_post_looks_up_enterprise_customer_once(self, request_or_stub_mock):
+        """
+        Tests that the POST endpoint resolves the requesting user's enterprise customer only once.
+        """
+        user, enterprise_customer = self._create_user_and_enterprise_customer('test_user', 'test_password')
+        client = APIClient()
+        client.login(username='test_user', password='test_password')
+        self._add_feature_role(user, ENTERPRISE_REPORTING_CONFIG_ADMIN_ROLE)
+        request_or_stub_mock.return_value = self.get_request_with_jwt_cookie(system_wide_role=ENTERPRISE_ADMIN_ROLE)
+
+        with mock.patch(
+                'enterprise.api.v1.views.get_enterprise_customer_from_user_id',
+                wraps=get_enterprise_customer_from_user_id,
+        ) as mock_get_enterprise_customer:
+            response = client.post(
+                '{server}{reverse_url}'.format(
+                    server=settings.TEST_SERVER,
+                    reverse_url=reverse('enterprise-customer-reporting-list'),
+                ),
+                data={
+                    'active': 'true',
+                    'delivery_method': 'email',
+                    'email': ['test@test.com'],
+                    'frequency': 'monthly',
+                    'day_of_month': 1,
+                    'hour_of_day': 1,
+                    'data_type': 'progress',
+                    'report_type': 'csv',
+                },
+                format='json',
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert self.load_json(response.content)['enterprise_customer']['uuid'] == str(enterprise_customer.uuid)
+        mock_get_enterprise_customer.assert_called_once_with(user.id)
+
     @mock.patch('enterprise.rules.crum.get_current_request')
     @ddt.data(
         (False, status.HTTP_403_FORBIDDEN),
@@ -879,3 +879,15 @@ class TestEnterpriseCatalogSignals(unittest.TestCase):
             enabled_course_modes=enterprise_catalog_2.enabled_course_modes,
             publish_audit_enrollment_urls=enterprise_catalog_2.publish_audit_enrollment_urls
         )
+
+    @mock.patch('enterprise.signals.invalidate_contains_content_items_cache')
+    def test_delete_enterprise_catalog_query_invalidates_contains_content_items(self, invalidate_cache_mock):
+        """
+        Deleting an EnterpriseCatalogQuery drops the cached contains_content_items answers.
+        """
+        test_query = EnterpriseCatalogQueryFactory()
+        invalidate_cache_mock.reset_mock()
+
+        test_query.delete()
+
+        invalidate_cache_mock.assert_called_once_with()
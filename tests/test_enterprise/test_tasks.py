@@ -4,12 +4,13 @@ Tests for the `edx-enterprise` tasks module.
 """
 
 import unittest
+from smtplib import SMTPException
 
 import mock
-from pytest import mark
+from pytest import mark, raises
 
 from enterprise.models import EnterpriseCourseEnrollment, EnterpriseEnrollmentSource
-from enterprise.tasks import create_enterprise_enrollment
+from enterprise.tasks import create_enterprise_enrollment, send_coupon_codes_request_email
 from test_utils.factories import EnterpriseCustomerFactory, EnterpriseCustomerUserFactory, UserFactory
 
 
@@ -99,3 +100,39 @@ class TestEnterpriseTasks(unittest.TestCase):
             self.enterprise_customer_user.id
         )
         assert EnterpriseCourseEnrollment.objects.count() == 1
+
+    @mock.patch('django.core.mail.send_mail')
+    def test_send_coupon_codes_request_email(self, mock_send_mail):
+        """
+        Task should send the coupon codes request email to the given recipients.
+        """
+        mock_send_mail.return_value = 1
+        send_coupon_codes_request_email('subject', 'body', 'from@example.com', ['cs@example.com'])
+        mock_send_mail.assert_called_once_with(
+            'subject',
+            'body',
+            'from@example.com',
+            ['cs@example.com'],
+            fail_silently=False
+        )
+
+    @mock.patch('enterprise.tasks.LOGGER')
+    @mock.patch('django.core.mail.send_mail')
+    def test_send_coupon_codes_request_email_failure(self, mock_send_mail, mock_logger):
+        """
+        Task should log and re-raise SMTP failures so that they can be retried.
+        """
+        mock_send_mail.side_effect = SMTPException()
+        with raises(SMTPException):
+            send_coupon_codes_request_email('subject', 'body', 'from@example.com', ['cs@example.com'])
+        mock_logger.error.assert_called_once()
+
+    @mock.patch('enterprise.tasks.LOGGER', mock.Mock())
+    @mock.patch('django.core.mail.send_mail')
+    def test_send_coupon_codes_request_email_retried(self, mock_send_mail):
+        """
+        Task should be retried when sending the email raises an SMTP failure.
+        """
+        mock_send_mail.side_effect = [SMTPException(), 1]
+        send_coupon_codes_request_email.delay('subject', 'body', 'from@example.com', ['cs@example.com'])
+        assert mock_send_mail.call_count == 2
@@ -9,13 +9,15 @@ import random
 import unittest
 
 import pytest
+import requests
 import responses
 from freezegun import freeze_time
 from six.moves.urllib.parse import urljoin  # pylint: disable=import-error
 
+from django.core.cache import cache
 from django.utils import timezone
 
-from integrated_channels.canvas.client import CanvasAPIClient
+from integrated_channels.canvas.client import _OAUTH_ACCESS_TOKENS, CanvasAPIClient
 from integrated_channels.exceptions import CanvasClientError, ClientError
 from test_utils import factories
 
@@ -32,6 +34,8 @@ class TestCanvasApiClient(unittest.TestCase):
 
     def setUp(self):
         super(TestCanvasApiClient, self).setUp()
+        cache.clear()
+        _OAUTH_ACCESS_TOKENS.clear()
         self.account_id = random.randint(1, 1000)
         self.canvas_email = "test@test.com"
         self.canvas_user_id = random.randint(1, 1000)
@@ -296,6 +300,84 @@ class TestCanvasApiClient(unittest.TestCase):
 
             assert canvas_api_client.session.headers["Authorization"] == "Bearer " + self.access_token
 
+    def test_client_session_reused_until_access_token_expires(self):
+        """ Test the client only fetches a new oauth access key once the previous one has expired"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                self.oauth_url,
+                json={"access_token": self.access_token, "expires_in": 3600},
+                status=200
+            )
+            canvas_api_client = CanvasAPIClient(self.enterprise_config)
+            canvas_api_client._create_session()  # pylint: disable=protected-access
+            session = canvas_api_client.session
+            canvas_api_client._create_session()  # pylint: disable=protected-access
+            assert canvas_api_client.session is session
+            assert len(rsps.calls) == 1
+
+            with freeze_time(NOW + datetime.timedelta(seconds=3539)):
+                canvas_api_client._create_session()  # pylint: disable=protected-access
+            assert canvas_api_client.session is session
+            assert len(rsps.calls) == 1
+
+            # The token is renewed a minute before Canvas says it expires.
+            with freeze_time(NOW + datetime.timedelta(seconds=3540)):
+                canvas_api_client._create_session()  # pylint: disable=protected-access
+            assert canvas_api_client.session is not session
+            assert len(rsps.calls) == 2
+
+    def test_client_reuses_cached_oauth_access_key(self):
+        """ Test new clients for the same configuration reuse an oauth access key which has not expired"""
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                self.oauth_url,
+                json={"access_token": self.access_token, "expires_in": 3600},
+                status=200
+            )
+            CanvasAPIClient(self.enterprise_config)._create_session()  # pylint: disable=protected-access
+            canvas_api_client = CanvasAPIClient(self.enterprise_config)
+            canvas_api_client._create_session()  # pylint: disable=protected-access
+
+            assert canvas_api_client.session.headers["Authorization"] == "Bearer " + self.access_token
+            assert len(rsps.calls) == 1
+
+            # A token about to expire is not handed to a new client.
+            with freeze_time(NOW + datetime.timedelta(seconds=3540)):
+                CanvasAPIClient(self.enterprise_config)._create_session()  # pylint: disable=protected-access
+            assert len(rsps.calls) == 2
+
+    def test_client_expires_rejected_oauth_access_key(self):
+        """ Test an oauth access key rejected by Canvas is not reused by the next session"""
+        course_to_update = json.dumps({
+            "course": {"integration_id": self.integration_id, "name": "test_course"}
+        }).encode()
+        course_id = 1
+        with responses.RequestsMock() as rsps:
+            rsps.add(
+                responses.POST,
+                self.oauth_url,
+                json={"access_token": self.access_token, "expires_in": 3600},
+                status=200
+            )
+            rsps.add(
+                responses.GET,
+                self.get_all_courses_url,
+                json=[{'name': 'test course', 'integration_id': self.integration_id, 'id': course_id}],
+                status=200
+            )
+            rsps.add(responses.PUT, self.update_url + str(course_id), status=401)
+            rsps.add(responses.PUT, self.update_url + str(course_id), body=b'Mock update response text')
+            canvas_api_client = CanvasAPIClient(self.enterprise_config)
+
+            with pytest.raises(requests.exceptions.HTTPError):
+                canvas_api_client.update_content_metadata(course_to_update)
+            CanvasAPIClient(self.enterprise_config).update_content_metadata(course_to_update)
+
+            oauth_calls = [call for call in rsps.calls if call.request.url == self.oauth_url]
+            assert len(oauth_calls) == 2
+
     def test_client_instantiation_fails_without_client_id(self):
         with pytest.raises(ClientError) as client_error:
             self.enterprise_config.client_id = None
@@ -436,3 +518,130 @@ class TestCanvasApiClient(unittest.TestCase):
                 body=b'Mock update response text'
             )
             canvas_api_client.update_content_metadata(course_to_update)
+
+    def test_client_update_requests_all_courses_once(self):
+        """
+        Test that updating several courses with one Canvas client only requests the account's courses once
+        """
+        other_integration_id = 'other integration id'
+        mock_all_courses_resp = [
+            {'name': 'test course', 'integration_id': self.integration_id, 'id': 1},
+            {'name': 'other course', 'integration_id': other_integration_id, 'id': 2}
+        ]
+        canvas_api_client = CanvasAPIClient(self.enterprise_config)
+
+        with responses.RequestsMock() as request_mock:
+            request_mock.add(
+                responses.GET,
+                self.get_all_courses_url,
+                json=mock_all_courses_resp,
+                status=200
+            )
+            request_mock.add(
+                responses.POST,
+                self.oauth_url,
+                json={'access_token': self.access_token},
+                status=200
+            )
+            for course in mock_all_courses_resp:
+                request_mock.add(
+                    responses.PUT,
+                    self.update_url + str(course['id']),
+                    body=b'Mock update response text'
+                )
+                canvas_api_client.update_content_metadata(json.dumps({
+                    "course": {"integration_id": course['integration_id'], "name": course['name']}
+                }).encode())
+
+            all_courses_calls = [
+                call for call in request_mock.calls if call.request.url.startswith(self.get_all_courses_url)
+            ]
+            assert len(all_courses_calls) == 1
+
+    def test_client_update_reuses_cached_course_ids(self):
+        """
+        Test that a new Canvas client reuses the course IDs cached by a previous one
+        """
+        course_to_update = json.dumps({
+            "course": {"integration_id": self.integration_id, "name": "test_course"}
+        }).encode()
+        course_id = 1
+        mock_all_courses_resp = [
+            {'name': 'test course', 'integration_id': self.integration_id, 'id': course_id},
+        ]
+
+        with responses.RequestsMock() as request_mock:
+            request_mock.add(
+                responses.GET,
+                self.get_all_courses_url,
+                json=mock_all_courses_resp,
+                status=200
+            )
+            request_mock.add(
+                responses.POST,
+                self.oauth_url,
+                json={'access_token': self.access_token},
+                status=200
+            )
+            request_mock.add(
+                responses.PUT,
+                self.update_url + str(course_id),
+                body=b'Mock update response text'
+            )
+            CanvasAPIClient(self.enterprise_config).update_content_metadata(course_to_update)
+            CanvasAPIClient(self.enterprise_config).update_content_metadata(course_to_update)
+
+            all_courses_calls = [
+                call for call in request_mock.calls if call.request.url.startswith(self.get_all_courses_url)
+            ]
+            assert len(all_courses_calls) == 1
+
+    def test_client_update_looks_up_stale_course_id_again(self):
+        """
+        Test that a cached course ID which Canvas no longer knows is looked up again once
+        """
+        course_to_update = json.dumps({
+            "course": {"integration_id": self.integration_id, "name": "test_course"}
+        }).encode()
+        stale_course_id = 1
+        course_id = 2
+
+        with responses.RequestsMock() as request_mock:
+            request_mock.add(
+                responses.GET,
+                self.get_all_courses_url,
+                json=[{'name': 'test course', 'integration_id': self.integration_id, 'id': stale_course_id}],
+                status=200
+            )
+            request_mock.add(
+                responses.GET,
+                self.get_all_courses_url,
+                json=[{'name': 'test course', 'integration_id': self.integration_id, 'id': course_id}],
+                status=200
+            )
+            request_mock.add(
+                responses.POST,
+                self.oauth_url,
+                json={'access_token': self.access_token},
+                status=200
+            )
+            request_mock.add(
+                responses.PUT,
+                self.update_url + str(stale_course_id),
+                body=b'Mock update response text'
+            )
+            request_mock.add(responses.PUT, self.update_url + str(stale_course_id), status=404)
+            request_mock.add(
+                responses.PUT,
+                self.update_url + str(course_id),
+                body=b'Mock update response text'
+            )
+            CanvasAPIClient(self.enterprise_config).update_content_metadata(course_to_update)
+            status_code, _ = CanvasAPIClient(self.enterprise_config).update_content_metadata(course_to_update)
+
+            assert status_code == 200
+            assert request_mock.calls[-1].request.url == self.update_url + str(course_id)
+            all_courses_calls = [
+                call for call in request_mock.calls if call.request.url.startswith(self.get_all_courses_url)
+            ]
+            assert len(all_courses_calls) == 2
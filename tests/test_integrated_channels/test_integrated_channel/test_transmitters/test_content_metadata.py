@@ -9,6 +9,9 @@ import ddt
 import mock
 from pytest import mark
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from enterprise.constants import ContentType
 from integrated_channels.exceptions import ClientError
 from integrated_channels.integrated_channel.exporters.content_metadata import ContentMetadataItemExport
@@ -155,6 +158,47 @@ class TestContentMetadataTransmitter(unittest.TestCase):
 
         assert updated_transmission.channel_metadata == channel_metadata
 
+    @ddt.data((100, 1), (2, 2))
+    @ddt.unpack
+    def test_transmit_update_saves_transmissions_in_batches(self, batch_size, expected_update_queries):
+        """
+        Test that the transmissions of updated content metadata items are saved with one query per batch.
+        """
+        content_ids = ['course:DemoX', 'course:DemoY', 'course:DemoZ']
+        payload = {}
+        for content_id in content_ids:
+            ContentMetadataItemTransmission(
+                enterprise_customer=self.enterprise_config.enterprise_customer,
+                integrated_channel_code=self.enterprise_config.channel_code(),
+                content_id=content_id,
+                channel_metadata={}
+            ).save()
+            payload[content_id] = ContentMetadataItemExport(
+                {
+                    'key': content_id,
+                    ContentType.METADATA_KEY: ContentType.COURSE
+                },
+                {'update': content_id},
+            )
+        self.update_content_metadata_mock.return_value = (200, '{"success":"true"}')
+        transmitter = ContentMetadataTransmitter(self.enterprise_config)
+
+        with mock.patch(
+            'integrated_channels.integrated_channel.transmitters.content_metadata.TRANSMISSION_UPDATE_BATCH_SIZE',
+            batch_size,
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                transmitter.transmit(payload)
+
+        update_queries = [query for query in queries if query['sql'].startswith('UPDATE')]
+        assert len(update_queries) == expected_update_queries
+        for content_id in content_ids:
+            assert ContentMetadataItemTransmission.objects.get(
+                enterprise_customer=self.enterprise_config.enterprise_customer,
+                integrated_channel_code=self.enterprise_config.channel_code(),
+                content_id=content_id,
+            ).channel_metadata == {'update': content_id}
+
     def test_transmit_update_not_needed(self):
         """
         Test successful update of content metadata during transmission.
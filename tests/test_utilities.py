@@ -1003,6 +1003,29 @@ class TestEnterpriseUtils(unittest.TestCase):
         request = mock.MagicMock(method='POST', query_params={'key': 'query_params'}, data={'key': 'data'})
         assert utils.get_request_value(request, 'key') == 'data'
 
+    @ddt.data(
+        ('GET', {'key': 'query_params'}, {}, 'query_params'),
+        ('GET', {}, {'key': 'data'}, 'data'),
+        ('POST', {}, {'key': 'data'}, 'data'),
+        ('POST', {'key': 'query_params'}, {}, 'query_params'),
+        ('POST', {}, {}, 'default'),
+    )
+    @ddt.unpack
+    def test_get_request_value_fallback(self, method, query_params, data, expected_value):
+        """
+        Request value falls back to the other source, and then to the default, only when the key is missing.
+        """
+        request = mock.MagicMock(method=method, query_params=query_params, data=data)
+        assert utils.get_request_value(request, 'key', 'default') == expected_value
+
+    def test_get_request_value_does_not_read_data_when_not_needed(self):
+        """
+        Request value found in the query parameters does not read the posted data.
+        """
+        request = mock.MagicMock(method='GET', query_params={'key': 'query_params'})
+        assert utils.get_request_value(request, 'key') == 'query_params'
+        request.data.get.assert_not_called()
+
     @ddt.data(
         (
             'MicroMasters Certificate',